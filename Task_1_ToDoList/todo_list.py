@@ -1,59 +1,1202 @@
+import argparse
+import atexit
+import bisect
+import csv
+import itertools
 import json
 import os
-from datetime import datetime
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date, datetime
 
 # --- Configuration & Global State ---
 
 # File where the task dictionary will be stored for persistence
 TASK_DATA_FILE = "my_task_records.json" 
-# Simple counter for assigning unique task IDs
-next_task_id = 1 
+# Append-only journal of edits made since the last full snapshot
+TASK_JOURNAL_FILE = "my_task_records.journal"
+# Lock file shared by every process using the files above; also holds the last task ID
+TASK_LOCK_FILE = "my_task_records.lock"
+# Once the journal grows past this many bytes it is folded into a new snapshot
+JOURNAL_COMPACT_BYTES = 1024 * 1024
+# Where tasks live: "json" (the file above) or "sqlite" (the database below)
+TASK_STORAGE_BACKEND = "json"
+TASK_DATABASE_FILE = "my_task_records.db"
+# Number of task rows shown per page in the list views
+DISPLAY_PAGE_SIZE = 20
 
-# --- Data Persistence Handlers ---
+# --- Metrics (opt-in instrumentation) ---
 
-def load_task_dictionary():
+class MetricsRegistry:
     """
-    Loads tasks from the JSON file. Tasks are stored in a dictionary 
-    for fast lookup, where the key is the task ID.
-    
+    In-process timings and counts per operation (load, save, log_changes,
+    search, display, export). Each operation keeps its number of calls, total
+    and slowest time, and the sum of every counter its callers report
+    (bytes written, tasks scanned, ...).
+    """
+
+    def __init__(self):
+        self.operations = {}
+
+    def record(self, operation, started, **counters):
+        """Adds one call of `operation` that began at time.perf_counter() value `started`."""
+        elapsed = time.perf_counter() - started
+        entry = self.operations.get(operation)
+        if entry is None:
+            entry = self.operations[operation] = {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0}
+        entry['count'] += 1
+        entry['total_seconds'] += elapsed
+        if elapsed > entry['max_seconds']:
+            entry['max_seconds'] = elapsed
+        for name, value in counters.items():
+            entry[name] = entry.get(name, 0) + value
+
+    def snapshot(self):
+        """Returns the metrics as a JSON-ready dict, with the mean time per call added."""
+        return {operation: dict(entry, mean_seconds=entry['total_seconds'] / entry['count'])
+                for operation, entry in sorted(self.operations.items())}
+
+    def dump(self, path):
+        """Writes the snapshot as JSON to `path` ('-' for stderr, keeping stdout for task output)."""
+        text = json.dumps({'recorded_at': datetime.now().isoformat(timespec='seconds'),
+                           'pid': os.getpid(),
+                           'backend': TASK_STORAGE_BACKEND,
+                           'operations': self.snapshot()}, indent=4)
+        if path == '-':
+            print(text, file=sys.stderr)
+            return
+        try:
+            with open(path, 'w') as file:
+                file.write(text + "\n")
+        except IOError as e:
+            print(f"[ERROR] Could not write metrics: {e}", file=sys.stderr)
+
+# The active registry. None (the default) switches instrumentation off: each
+# instrumented handler then costs a single `is None` check.
+TASK_METRICS = None
+
+def enable_metrics(dump_path=None):
+    """
+    Starts recording metrics (see MetricsRegistry) and, if `dump_path` is
+    given, writes them there as JSON when the program exits.
+
+    Returns:
+        MetricsRegistry: the active registry
+    """
+    global TASK_METRICS
+    if TASK_METRICS is None:
+        TASK_METRICS = MetricsRegistry()
+    if dump_path:
+        atexit.register(TASK_METRICS.dump, dump_path)
+    return TASK_METRICS
+
+# --- Compact Task Records ---
+
+# Stored in place of a due date when the task has none ("N/A" in the JSON file)
+NO_DUE_DATE = 0
+ISO_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+TIMESTAMP_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}")
+
+def date_to_ordinal(text):
+    """Returns the day number of a YYYY-MM-DD date, or None if it is not a valid date."""
+    if not ISO_DATE_PATTERN.fullmatch(text):
+        return None
+    try:
+        return date(int(text[0:4]), int(text[5:7]), int(text[8:10])).toordinal()
+    except ValueError:
+        return None
+
+def timestamp_to_minutes(text):
+    """Returns a 'YYYY-MM-DD HH:MM' timestamp as minutes since 0001-01-01, or None."""
+    if not TIMESTAMP_PATTERN.fullmatch(text):
+        return None
+    day = date_to_ordinal(text[:10])
+    hour, minute = int(text[11:13]), int(text[14:16])
+    if day is None or hour > 23 or minute > 59:
+        return None
+    return day * 1440 + hour * 60 + minute
+
+
+class Task:
+    """
+    A single to-do item. Uses __slots__ instead of a per-task dict, keeps the
+    ID as an int, shares identical descriptions via sys.intern, and stores
+    dates as integers (day or minute numbers, NO_DUE_DATE when missing).
+    Dates that were typed in some other format are kept as text, so every
+    record still round-trips to exactly what the JSON file held.
+    `version` counts the edits made to the task since it was created; the
+    JSON store uses it to detect edits that raced with another process.
+    """
+    __slots__ = ('id', 'description', 'completed', '_created', '_due', 'version')
+
+    def __init__(self, task_id, description, completed=False, created_at="", due_date="N/A", version=0):
+        self.id = int(task_id)
+        self.description = sys.intern(description)
+        self.completed = completed
+        self.version = version
+        minutes = timestamp_to_minutes(created_at)
+        self._created = minutes if minutes is not None else created_at
+        if due_date == "N/A":
+            self._due = NO_DUE_DATE
+        else:
+            day = date_to_ordinal(due_date)
+            self._due = day if day is not None else due_date
+
+    @property
+    def created_at(self):
+        if isinstance(self._created, str):
+            return self._created
+        day, minutes = divmod(self._created, 1440)
+        return f"{date.fromordinal(day).isoformat()} {minutes // 60:02d}:{minutes % 60:02d}"
+
+    @property
+    def due_date(self):
+        if self._due == NO_DUE_DATE:
+            return "N/A"
+        if isinstance(self._due, str):
+            return self._due
+        return date.fromordinal(self._due).isoformat()
+
+    @property
+    def due_ordinal(self):
+        """The due date as a day number, or None when there is no (valid) due date."""
+        if self._due == NO_DUE_DATE or isinstance(self._due, str):
+            return None
+        return self._due
+
+    @classmethod
+    def from_record(cls, record):
+        """Builds a Task from its JSON dictionary layout."""
+        return cls(record['id'], record['description'], record['completed'],
+                   record['created_at'], record['due_date'], record.get('version', 0))
+
+    def to_record(self):
+        """Returns the task in the JSON dictionary layout used by the task file."""
+        record = {
+            'id': str(self.id),
+            'description': self.description,
+            'completed': self.completed,
+            'created_at': self.created_at,
+            'due_date': self.due_date
+        }
+        if self.version:
+            # Left out for never-edited tasks, so those keep the original layout
+            record['version'] = self.version
+        return record
+
+
+# --- Keyword Search Index ---
+
+class TaskSearchIndex:
+    """
+    Inverted index over task descriptions: each lower-cased word maps to the
+    set of task IDs containing it. A second, much smaller index maps every
+    3-letter fragment to the words containing it, so partial keywords
+    ("ilk" -> "milk") resolve without scanning every task. Keywords shorter
+    than a fragment ("lk" -> "milk") are found among the fragments, which are
+    far fewer than the words.
+
+    Results may be the index's own posting sets: callers must not modify them.
+    """
+    WORD_PATTERN = re.compile(r"\w+")
+    GRAM_SIZE = 3
+
+    def __init__(self):
+        self.postings = {}      # word -> set of task IDs
+        self.word_grams = {}    # 3-letter fragment -> set of words
+        self.short_words = set()  # words shorter than a fragment (they have none)
+        self.expansions = {}    # keyword -> words containing it; cleared when the vocabulary changes
+        self.last_scanned = 0   # candidate task IDs the last search looked at
+
+    def tokenize(self, text):
+        return self.WORD_PATTERN.findall(text.lower())
+
+    def _grams(self, word):
+        size = self.GRAM_SIZE
+        return {word[i:i + size] for i in range(len(word) - size + 1)}
+
+    def add_task(self, task_id, description):
+        for word in set(self.tokenize(description)):
+            ids = self.postings.get(word)
+            if ids is None:
+                ids = self.postings[word] = set()
+                for gram in self._grams(word):
+                    self.word_grams.setdefault(gram, set()).add(word)
+                if len(word) < self.GRAM_SIZE:
+                    self.short_words.add(word)
+                if self.expansions:
+                    self.expansions.clear()
+            ids.add(task_id)
+
+    def remove_task(self, task_id, description):
+        for word in set(self.tokenize(description)):
+            ids = self.postings.get(word)
+            if ids is None:
+                continue
+            ids.discard(task_id)
+            if not ids:
+                # Last task using this word: drop it from the fragment index too
+                del self.postings[word]
+                self.short_words.discard(word)
+                if self.expansions:
+                    self.expansions.clear()
+                for gram in self._grams(word):
+                    words = self.word_grams.get(gram)
+                    if words is not None:
+                        words.discard(word)
+                        if not words:
+                            del self.word_grams[gram]
+
+    def _words_containing(self, term):
+        """Returns every indexed word that contains `term` as a substring."""
+        words = self.expansions.get(term)
+        if words is None:
+            words = self.expansions[term] = self._expand(term)
+        return words
+
+    def _expand(self, term):
+        if len(term) < self.GRAM_SIZE:
+            # Any longer word containing a short keyword has a fragment
+            # containing it, so scan the fragments instead of the vocabulary
+            words = {word for word in self.short_words if term in word}
+            for gram, gram_words in self.word_grams.items():
+                if term in gram:
+                    words |= gram_words
+            return list(words)
+
+        grams = sorted(self._grams(term), key=lambda g: len(self.word_grams.get(g, ())))
+        candidates = self.word_grams.get(grams[0])
+        if not candidates:
+            return []
+        for gram in grams[1:]:
+            candidates = candidates & self.word_grams.get(gram, set())
+            if not candidates:
+                return []
+        return [word for word in candidates if term in word]
+
+    def lookup_term(self, term):
+        """Returns the IDs of tasks with a word containing `term` (do not modify the set)."""
+        words = self._words_containing(term)
+        if len(words) == 1:
+            return self.postings[words[0]]
+        return set().union(*(self.postings[word] for word in words))
+
+    def search(self, query):
+        """
+        Evaluates a keyword query. Space-separated keywords must all match (AND);
+        groups separated by the word OR are alternatives.
+        e.g. "milk bread OR eggs" -> (milk AND bread) OR eggs
+        """
+        group_results = []
+        scanned = 0
+        for group in re.split(r"\s+OR\s+", query.strip()):
+            terms = self.tokenize(group)
+            if not terms:
+                continue
+            # Intersect the rarest terms first to keep the working set small
+            term_sets = sorted((self.lookup_term(term) for term in terms), key=len)
+            scanned += sum(map(len, term_sets))
+            group_matches = term_sets[0]
+            for term_set in term_sets[1:]:
+                # A new set each time: the term sets may be the index's own
+                group_matches = group_matches & term_set
+                if not group_matches:
+                    break
+            group_results.append(group_matches)
+        self.last_scanned = scanned
+        if len(group_results) == 1:
+            return group_results[0]
+        return set().union(*group_results)
+
+
+# --- Ordered Views (ID order, status, due date) ---
+
+class TaskViewIndex:
+    """
+    Keeps task IDs pre-sorted so the list views never sort or filter the whole store.
+    IDs are kept in three sorted lists (all, done, to-do), and tasks with a valid
+    due date are kept in a list of (due day number, id) pairs sorted by date.
+    """
+
+    def __init__(self, tasks=None):
+        tasks = tasks or {}
+        self.ordered_ids = sorted(tasks)
+        self.status_ids = {True: [], False: []}
+        self.due_entries = []
+        for task_id in self.ordered_ids:
+            task = tasks[task_id]
+            self.status_ids[task.completed].append(task_id)
+            if task.due_ordinal is not None:
+                self.due_entries.append((task.due_ordinal, task_id))
+        self.due_entries.sort()
+
+    @staticmethod
+    def _insert(sorted_list, item):
+        # New IDs are always the largest, so appending is the common case
+        if not sorted_list or sorted_list[-1] < item:
+            sorted_list.append(item)
+        else:
+            bisect.insort(sorted_list, item)
+
+    @staticmethod
+    def _remove(sorted_list, item):
+        position = bisect.bisect_left(sorted_list, item)
+        if position < len(sorted_list) and sorted_list[position] == item:
+            del sorted_list[position]
+
+    def add_task(self, task):
+        self._insert(self.ordered_ids, task.id)
+        self._insert(self.status_ids[task.completed], task.id)
+        if task.due_ordinal is not None:
+            bisect.insort(self.due_entries, (task.due_ordinal, task.id))
+
+    def remove_task(self, task):
+        self._remove(self.ordered_ids, task.id)
+        self._remove(self.status_ids[task.completed], task.id)
+        if task.due_ordinal is not None:
+            self._remove(self.due_entries, (task.due_ordinal, task.id))
+
+    def set_completed(self, task, was_completed):
+        """Moves a task between the done and to-do lists after it was toggled."""
+        self._remove(self.status_ids[was_completed], task.id)
+        self._insert(self.status_ids[task.completed], task.id)
+
+    def id_list(self, filter_status=None, due_before=None):
+        """
+        Returns the sorted list of task IDs for a view: every task in ID order,
+        only done or to-do tasks, or tasks due strictly before the YYYY-MM-DD
+        date `due_before` (earliest first). The ID-ordered lists are returned
+        as-is, not copied.
+        """
+        if due_before is not None:
+            end = bisect.bisect_left(self.due_entries, (date_to_ordinal(due_before),))
+            return [task_id for _, task_id in self.due_entries[:end]]
+        if filter_status is None:
+            return self.ordered_ids
+        return self.status_ids[filter_status]
+
+
+# --- Multi-Process Locking ---
+
+if os.name == 'nt':
+    import msvcrt
+
+    def _lock_file(file):
+        file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # LK_LOCK gives up after about 10 seconds; keep waiting
+                continue
+
+    def _unlock_file(file):
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_file(file):
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(file):
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+class TaskFileLock:
+    """
+    Advisory lock on TASK_LOCK_FILE that serializes every write to the task
+    files across processes. It is re-entrant within a process. The lock file
+    also holds the last task ID handed out by any process, so IDs stay unique.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.depth = 0
+        self.file = None
+
+    def __enter__(self):
+        if self.depth == 0:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+            self.file = os.fdopen(fd, 'r+')
+            try:
+                _lock_file(self.file)
+            except BaseException:
+                self.file.close()
+                raise
+        self.depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self.depth -= 1
+        if self.depth == 0:
+            _unlock_file(self.file)
+            self.file.close()
+            self.file = None
+
+    def read_last_id(self):
+        self.file.seek(0)
+        text = self.file.read().strip()
+        return int(text) if text.isdigit() else 0
+
+    def write_last_id(self, task_id):
+        self.file.seek(0)
+        self.file.truncate()
+        self.file.write(str(task_id))
+        self.file.flush()
+
+
+def _file_stamp(path):
+    """Identifies one version of a file; os.replace() always produces a new stamp."""
+    try:
+        info = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (info.st_ino, info.st_mtime_ns, info.st_size)
+
+# --- In-Memory Task Store (JSON file backend) ---
+
+# pending_bases value for a task that has no tracked edit
+_UNKNOWN_BASE = object()
+
+def _record_task_id(record):
+    """The ID of the task a journal record ('put' or 'delete') is about."""
+    if record.get('op') == 'put':
+        task = record['task']
+        return task.id if isinstance(task, Task) else int(task['id'])
+    return int(record['id'])
+
+class TaskStore(dict):
+    """
+    The task collection used with the JSON file backend: a dict of Task records
+    keyed by ID that also keeps the keyword and view indexes current.
+    Edits are persisted through the journal, full saves through a snapshot.
+
+    Several processes may share the same files. Every write happens under
+    TaskFileLock and first merges whatever the other processes wrote since we
+    last looked (new journal records, or a whole new snapshot). Our own pending
+    records are then checked against what was merged: an edit to a task that
+    another process changed or deleted after our edit started from it is a
+    conflict and is dropped (see _merge_from_disk); the others are re-applied.
+    """
+
+    def __init__(self, tasks=None, last_assigned_id=0, lock=None):
+        super().__init__(tasks or {})
+        # Never hand out an ID again, even if its task was deleted
+        self.last_assigned_id = max(last_assigned_id, max(self, default=0))
+        self.lock = lock or TaskFileLock(TASK_LOCK_FILE)
+        # How much of the journal, and which snapshot, this process has seen
+        self.journal_offset = 0
+        self.snapshot_stamp = None
+        # Bytes this process has written to the snapshot and journal (for the metrics)
+        self.bytes_written = 0
+        # Task ID -> the version our not-yet-logged edits to it started from (None: a new task)
+        self.pending_bases = {}
+        self._build_indexes()
+
+    def _build_indexes(self):
+        self.search_index = TaskSearchIndex()
+        for task in self.values():
+            self.search_index.add_task(task.id, task.description)
+        self.view_index = TaskViewIndex(self)
+
+    def allocate_ids(self, count):
+        """
+        Reserves `count` consecutive task IDs, unique across every process
+        sharing the files, under a single lock.
+
+        Returns:
+            range: the reserved IDs
+        """
+        with self.lock:
+            first = max(self.lock.read_last_id(), self.last_assigned_id) + 1
+            self.last_assigned_id = first + count - 1
+            self.lock.write_last_id(self.last_assigned_id)
+        return range(first, first + count)
+
+    def allocate_id(self):
+        """Hands out the next task ID, unique across every process sharing the files."""
+        return self.allocate_ids(1)[0]
+
+    def _insert(self, task):
+        self[task.id] = task
+        self.search_index.add_task(task.id, task.description)
+        self.view_index.add_task(task)
+
+    def _remove(self, task_id):
+        task = self.pop(task_id, None)
+        if task is not None:
+            self.search_index.remove_task(task.id, task.description)
+            self.view_index.remove_task(task)
+        return task
+
+    def add(self, task):
+        self.pending_bases.setdefault(task.id, None)
+        self._insert(task)
+
+    def set_completed(self, task, completed):
+        if task.completed != completed:
+            self.pending_bases.setdefault(task.id, task.version)
+            task.completed = completed
+            task.version += 1
+            self.view_index.set_completed(task, not completed)
+
+    def discard(self, task_id):
+        """Removes a task if present. Returns the removed Task or None."""
+        task = self._remove(task_id)
+        if task is not None:
+            self.pending_bases.setdefault(task_id, task.version)
+        return task
+
+    def search(self, query):
+        """Returns the tasks matching a keyword query (see TaskSearchIndex.search), in ID order."""
+        return list(map(self.__getitem__, sorted(self.search_index.search(query))))
+
+    def id_list(self, filter_status=None, due_before=None):
+        return self.view_index.id_list(filter_status, due_before)
+
+    def iter_tasks(self, task_ids):
+        return (self[task_id] for task_id in task_ids)
+
+    def _apply_record(self, record):
+        """Applies one journal record, keeping the indexes current. Returns the task ID."""
+        task_id = _record_task_id(record)
+        if record.get('op') == 'put':
+            task = record['task']
+            if not isinstance(task, Task):
+                task = Task.from_record(task)
+            self._remove(task_id)
+            self._insert(task)
+        elif record.get('op') == 'delete':
+            self._remove(task_id)
+        self.last_assigned_id = max(self.last_assigned_id, task_id)
+        return task_id
+
+    def _edit_still_applies(self, task_id, record):
+        """
+        Whether our pending edit to a task may be re-applied over merged changes:
+        the task must still be at the version the edit started from.
+        """
+        base = self.pending_bases.get(task_id, _UNKNOWN_BASE)
+        if base is _UNKNOWN_BASE:
+            # Not edited through this store's methods: the last writer wins
+            return True
+        current = self.get(task_id)
+        if current is None:
+            # Deleted by someone else: only creating it or deleting it again still fits
+            return base is None or record.get('op') == 'delete'
+        return current.version == base
+
+    def _merge_from_disk(self, pending_records):
+        """
+        Brings this store up to date with the files (the caller holds the lock).
+        `pending_records` are our own edits, already applied in memory but not
+        yet written. Only those touching a task that the merge changed need any
+        work: each is re-applied over the merged state, unless the other process
+        changed or deleted the task after our edit started from it. Such a
+        conflicting edit is dropped and the task keeps the other process's state.
+
+        Returns:
+            list: the pending records dropped as conflicts
+        """
+        stamp = _file_stamp(TASK_DATA_FILE)
+        if stamp != self.snapshot_stamp:
+            # Someone compacted the journal into a new snapshot: start over from it
+            tasks, last_assigned_id = _read_snapshot()
+            records, self.journal_offset = _read_journal()
+            _replay_records(tasks, records)
+            self.clear()
+            self.update(tasks)
+            self.last_assigned_id = max(self.last_assigned_id, last_assigned_id, max(self, default=0))
+            self._build_indexes()
+            self.snapshot_stamp = stamp
+            touched = None  # any task may differ from our copy now
+        else:
+            records, self.journal_offset = _read_journal(self.journal_offset)
+            if not records:
+                return []
+            touched = {self._apply_record(record) for record in records}
+
+        conflicts = []
+        still_applies = {}
+        for record in pending_records:
+            task_id = _record_task_id(record)
+            if touched is not None and task_id not in touched:
+                continue  # nobody else changed it: memory still holds our edit
+            if task_id not in still_applies:
+                still_applies[task_id] = self._edit_still_applies(task_id, record)
+            if still_applies[task_id]:
+                self._apply_record(record)
+            else:
+                conflicts.append(record)
+        return conflicts
+
+    def refresh(self):
+        """Picks up edits made by other processes since the last read or write."""
+        with self.lock:
+            self._merge_from_disk([])
+
+    def log_changes(self, records):
+        """
+        Appends a batch of edit records to the journal in a single write instead of
+        rewriting the whole file. When the journal would grow past JOURNAL_COMPACT_BYTES,
+        a fresh snapshot (which already contains the batch) is written instead.
+        Edits that conflict with another process's (see _merge_from_disk) are
+        reported and left out.
+
+        Returns:
+            list: the records that were dropped as conflicts
+        """
+        if not records:
+            return []
+        lines = [json.dumps(record, default=Task.to_record) + "\n" for record in records]
+        with self.lock:
+            conflicts = self._merge_from_disk(records)
+            for record in records:
+                self.pending_bases.pop(_record_task_id(record), None)
+            if conflicts:
+                dropped = set(map(id, conflicts))
+                lines = [line for record, line in zip(records, lines) if id(record) not in dropped]
+                for task_id in sorted({_record_task_id(record) for record in conflicts}):
+                    print(f"[ALERT] Task ID {task_id} was changed or deleted by another process; "
+                          "your edit to it was discarded.")
+            payload = "".join(lines)
+            if not payload:
+                return conflicts
+            journal_size = os.path.getsize(TASK_JOURNAL_FILE) if os.path.exists(TASK_JOURNAL_FILE) else 0
+            if journal_size + len(payload) > JOURNAL_COMPACT_BYTES:
+                self.save()
+                return conflicts
+
+            if self.journal_offset < journal_size:
+                # The journal ends in a line torn by a crash; don't glue our first record to it
+                payload = "\n" + payload
+            data = payload.encode('utf-8')
+            try:
+                with open(TASK_JOURNAL_FILE, 'ab') as journal:
+                    journal.write(data)
+                self.journal_offset = journal_size + len(data)
+                self.bytes_written += len(data)
+            except IOError as e:
+                print(f"[ERROR] Could not write to task journal: {e}")
+        return conflicts
+
+    def save(self):
+        """
+        Writes a full snapshot of the tasks and then empties the journal.
+        The snapshot goes to a temporary file that is renamed over the old one,
+        so a crash mid-save leaves either the old or the new snapshot, never a torn file.
+        """
+        with self.lock:
+            # Fold in everyone else's edits first so the snapshot drops nothing
+            self._merge_from_disk([])
+            data = {
+                'tasks': self,
+                'last_assigned_id': self.last_assigned_id # Store the last ID used
+            }
+            data_dir = os.path.dirname(os.path.abspath(TASK_DATA_FILE))
+            try:
+                fd, temp_path = tempfile.mkstemp(prefix=".tasks-", suffix=".tmp", dir=data_dir)
+                try:
+                    # mkstemp creates the file owner-only; give it the usual permissions
+                    umask = os.umask(0)
+                    os.umask(umask)
+                    os.chmod(temp_path, 0o666 & ~umask)
+                    with os.fdopen(fd, 'w') as file:
+                        json.dump(data, file, indent=4, default=Task.to_record)
+                        file.flush()
+                        os.fsync(file.fileno())
+                    os.replace(temp_path, TASK_DATA_FILE)
+                except BaseException:
+                    os.unlink(temp_path)
+                    raise
+                # The snapshot now holds every journaled edit
+                open(TASK_JOURNAL_FILE, 'w').close()
+                self.journal_offset = 0
+                self.snapshot_stamp = _file_stamp(TASK_DATA_FILE)
+                self.bytes_written += self.snapshot_stamp[2]
+                # Everything in memory is on disk now; later edits start from here
+                self.pending_bases.clear()
+            except IOError as e:
+                print(f"[ERROR] Could not save task data: {e}")
+
+
+def _task_object_hook(obj):
+    # Turn task dictionaries into Task records as the JSON parser produces them,
+    # so the whole file never exists as a million dicts at once
+    if 'description' in obj and 'id' in obj:
+        return Task.from_record(obj)
+    return obj
+
+def _read_snapshot():
+    """
+    Reads the JSON snapshot.
+
+    Returns:
+        tuple: (dict of Task records keyed by ID, last assigned ID)
+    """
+    if not os.path.exists(TASK_DATA_FILE):
+        return {}, 0
+    try:
+        with open(TASK_DATA_FILE, 'r') as file:
+            data = json.load(file, object_hook=_task_object_hook)
+            tasks = {task.id: task for task in data.get('tasks', {}).values()}
+            return tasks, data.get('last_assigned_id', 0)
+    except (json.JSONDecodeError, FileNotFoundError):
+        # Handle empty or corrupt files gracefully
+        print("\n[INFO] Task file not found or corrupted. Starting fresh.")
+        return {}, 0
+
+def _read_journal(offset=0):
+    """
+    Reads the journal records written after byte `offset`.
+    A torn last line (from a crash mid-append) is left unread.
+
+    Returns:
+        tuple: (list of records, offset just past the last complete line)
+    """
+    records = []
+    if not os.path.exists(TASK_JOURNAL_FILE):
+        return records, 0
+
+    with open(TASK_JOURNAL_FILE, 'rb') as journal:
+        journal.seek(offset)
+        for line in journal:
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A line torn by a crash and then terminated by the next writer
+                continue
+    return records, offset
+
+def _replay_records(tasks, records):
+    """
+    Applies journal records to a plain dict of tasks, in order.
+    Every record is idempotent ('put' stores the whole task, 'delete' removes it),
+    so replaying a journal that was already folded into the snapshot is harmless.
+
     Returns:
-        tuple: (dict_of_tasks, next_available_id)
+        int: the highest task ID mentioned in the records (0 if none)
+    """
+    max_id = 0
+    for record in records:
+        if record.get('op') == 'put':
+            task = Task.from_record(record['task'])
+            tasks[task.id] = task
+            max_id = max(max_id, task.id)
+        elif record.get('op') == 'delete':
+            task_id = int(record['id'])
+            tasks.pop(task_id, None)
+            max_id = max(max_id, task_id)
+    return max_id
+
+def load_json_task_store():
+    """
+    Loads tasks from the JSON snapshot and replays the journal on top of it.
+
+    Returns:
+        TaskStore: the tasks keyed by integer ID
+    """
+    lock = TaskFileLock(TASK_LOCK_FILE)
+    with lock:
+        snapshot_stamp = _file_stamp(TASK_DATA_FILE)
+        tasks, last_assigned_id = _read_snapshot()
+        records, journal_offset = _read_journal()
+    journal_max_id = _replay_records(tasks, records)
+
+    store = TaskStore(tasks, max(last_assigned_id, journal_max_id), lock)
+    store.snapshot_stamp = snapshot_stamp
+    store.journal_offset = journal_offset
+    return store
+
+# --- SQLite Task Store ---
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    description TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    due_date TEXT NOT NULL DEFAULT 'N/A',
+    due_day INTEGER
+);
+CREATE INDEX IF NOT EXISTS tasks_by_status ON tasks (completed, id);
+CREATE INDEX IF NOT EXISTS tasks_by_due_day ON tasks (due_day, id) WHERE due_day IS NOT NULL;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Full-text index over descriptions, kept in sync by triggers. The trigram
+# tokenizer answers substring queries, matching the in-memory keyword search.
+SQLITE_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    description, content='tasks', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts (rowid, description) VALUES (new.id, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, description) VALUES ('delete', old.id, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF description ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, description) VALUES ('delete', old.id, old.description);
+    INSERT INTO tasks_fts (rowid, description) VALUES (new.id, new.description);
+END;
+"""
+
+TASK_COLUMNS = "id, description, completed, created_at, due_date"
+
+
+def _task_from_row(row):
+    return Task(row[0], row[1], bool(row[2]), row[3], row[4])
+
+
+class SqliteTaskIdView:
+    """
+    A read-only sequence of task IDs defined by a query. Nothing is fetched until
+    it is sliced, iterated or counted, so paging through a view of a million
+    tasks only ever reads one page.
+    """
+
+    def __init__(self, connection, where="1", params=(), order=("id",)):
+        self.connection = connection
+        self.where = where
+        self.params = tuple(params)
+        self.order = order
+        self._length = None
+
+    def _select(self, columns, extra=""):
+        order = ", ".join(self.order)
+        return (f"SELECT {columns} FROM tasks WHERE {self.where} ORDER BY {order} {extra}")
+
+    def __len__(self):
+        if self._length is None:
+            self._length = self.connection.execute(
+                f"SELECT COUNT(*) FROM tasks WHERE {self.where}", self.params).fetchone()[0]
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return list(self)[index]
+            rows = self.connection.execute(self._select("id", "LIMIT ? OFFSET ?"),
+                                           self.params + (max(stop - start, 0), start))
+            return [row[0] for row in rows]
+        if index < 0:
+            index += len(self)
+        row = self.connection.execute(self._select("id", "LIMIT 1 OFFSET ?"),
+                                      self.params + (index,)).fetchone()
+        if index < 0 or row is None:
+            raise IndexError("task view index out of range")
+        return row[0]
+
+    def __iter__(self):
+        return (row[0] for row in self.connection.execute(self._select("id"), self.params))
+
+    def __contains__(self, task_id):
+        row = self.connection.execute(
+            f"SELECT 1 FROM tasks WHERE ({self.where}) AND id = ?", self.params + (task_id,)).fetchone()
+        return row is not None
+
+    def index(self, task_id):
+        """Position of a task in the view, counted with the view's own ordering."""
+        key = self.connection.execute(
+            f"SELECT {', '.join(self.order)} FROM tasks WHERE ({self.where}) AND id = ?",
+            self.params + (task_id,)).fetchone()
+        if key is None:
+            raise ValueError(f"task {task_id} is not in this view")
+        before = self.connection.execute(
+            f"SELECT COUNT(*) FROM tasks WHERE ({self.where}) AND ({', '.join(self.order)}) < "
+            f"({', '.join('?' * len(key))})", self.params + tuple(key)).fetchone()[0]
+        return before
+
+    def iter_tasks(self):
+        """Streams the Task records of the whole view in order."""
+        return map(_task_from_row, self.connection.execute(self._select(TASK_COLUMNS), self.params))
+
+
+class SqliteTaskStore:
+    """
+    Task collection kept in a SQLite database instead of in memory. Opening it
+    reads nothing but the schema; tasks are fetched on demand, and the status,
+    due-date and full-text indexes answer the list views and keyword searches.
+    Edits run inside a transaction that log_changes/save commit.
     """
-    global next_task_id
-    if os.path.exists(TASK_DATA_FILE):
+
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SQLITE_SCHEMA)
         try:
-            with open(TASK_DATA_FILE, 'r') as file:
-                data = json.load(file)
-                tasks = data.get('tasks', {})
-                # Ensure the next ID is higher than any existing ID
-                if tasks:
-                    max_id = max(int(k) for k in tasks.keys())
-                    next_task_id = max_id + 1
-                return tasks
-        except (json.JSONDecodeError, FileNotFoundError):
-            # Handle empty or corrupt files gracefully
-            print("\n[INFO] Task file not found or corrupted. Starting fresh.")
-            return {}
-    return {}
+            self.connection.executescript(SQLITE_FTS_SCHEMA)
+            self.has_fulltext = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5 / trigram support: search falls back to LIKE
+            self.has_fulltext = False
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def __bool__(self):
+        return self.connection.execute("SELECT 1 FROM tasks LIMIT 1").fetchone() is not None
+
+    def __contains__(self, task_id):
+        return self.get(task_id) is not None
+
+    def __iter__(self):
+        return iter(SqliteTaskIdView(self.connection))
+
+    def __getitem__(self, task_id):
+        task = self.get(task_id)
+        if task is None:
+            raise KeyError(task_id)
+        return task
+
+    def get(self, task_id, default=None):
+        row = self.connection.execute(
+            f"SELECT {TASK_COLUMNS} FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return _task_from_row(row) if row is not None else default
+
+    def allocate_ids(self, count):
+        self.connection.execute(
+            "INSERT INTO meta (key, value) VALUES ('last_assigned_id', ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = value + excluded.value", (count,))
+        last = self.connection.execute(
+            "SELECT value FROM meta WHERE key = 'last_assigned_id'").fetchone()[0]
+        return range(last - count + 1, last + 1)
+
+    def allocate_id(self):
+        return self.allocate_ids(1)[0]
+
+    def add(self, task):
+        self.add_many([task])
+
+    def add_many(self, tasks):
+        # An upsert rather than INSERT OR REPLACE: REPLACE deletes the old row
+        # without firing tasks_fts_delete, leaving its words in the search index
+        self.connection.executemany(
+            "INSERT INTO tasks (id, description, completed, created_at, due_date, due_day) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (id) DO UPDATE SET description = excluded.description, "
+            "completed = excluded.completed, created_at = excluded.created_at, "
+            "due_date = excluded.due_date, due_day = excluded.due_day",
+            ((task.id, task.description, int(task.completed), task.created_at,
+              task.due_date, task.due_ordinal) for task in tasks))
+
+    def set_completed(self, task, completed):
+        task.completed = completed
+        self.connection.execute("UPDATE tasks SET completed = ? WHERE id = ?",
+                                (int(completed), task.id))
+
+    def discard(self, task_id):
+        """Removes a task if present. Returns the removed Task or None."""
+        task = self.get(task_id)
+        if task is not None:
+            self.connection.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        return task
+
+    def search(self, query):
+        """
+        Returns the tasks matching a keyword query, in ID order, with the same
+        rules as TaskSearchIndex.search: keywords are ANDed, OR separates groups.
+        """
+        group_clauses = []
+        params = []
+        for group in re.split(r"\s+OR\s+", query.strip()):
+            terms = TaskSearchIndex.WORD_PATTERN.findall(group.lower())
+            if not terms:
+                continue
+            term_clauses = []
+            # One MATCH per group lets FTS5 intersect the terms itself
+            fulltext_terms = [term for term in terms if self.has_fulltext and len(term) >= 3]
+            if fulltext_terms:
+                term_clauses.append("id IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?)")
+                params.append(" AND ".join(f'"{term}"' for term in fulltext_terms))
+            for term in terms:
+                if term not in fulltext_terms:
+                    # Trigrams need at least 3 characters
+                    term_clauses.append("description LIKE ?")
+                    params.append(f"%{term}%")
+            group_clauses.append("(" + " AND ".join(term_clauses) + ")")
+        if not group_clauses:
+            return []
+        rows = self.connection.execute(
+            f"SELECT {TASK_COLUMNS} FROM tasks WHERE {' OR '.join(group_clauses)} ORDER BY id", params)
+        return [_task_from_row(row) for row in rows]
+
+    def id_list(self, filter_status=None, due_before=None):
+        if due_before is not None:
+            return SqliteTaskIdView(self.connection, "due_day IS NOT NULL AND due_day < ?",
+                                    (date_to_ordinal(due_before),), ("due_day", "id"))
+        if filter_status is None:
+            return SqliteTaskIdView(self.connection)
+        return SqliteTaskIdView(self.connection, "completed = ?", (int(filter_status),))
+
+    def iter_tasks(self, task_ids):
+        if isinstance(task_ids, SqliteTaskIdView):
+            yield from task_ids.iter_tasks()
+            return
+        task_ids = list(task_ids)
+        # Fetch in chunks to stay under SQLite's bound-parameter limit
+        for start in range(0, len(task_ids), 500):
+            chunk = task_ids[start:start + 500]
+            rows = self.connection.execute(
+                f"SELECT {TASK_COLUMNS} FROM tasks WHERE id IN ({', '.join('?' * len(chunk))})", chunk)
+            by_id = {row[0]: _task_from_row(row) for row in rows}
+            for task_id in chunk:
+                yield by_id[task_id]
+
+    def refresh(self):
+        """Nothing to do: every query already reads the database (SQLite handles the locking)."""
+
+    def log_changes(self, records):
+        """
+        The edits are already in the open transaction; commit them in one go.
+        (SQLite's own locking serializes writers, so there are no conflicts to report.)
+        """
+        self.connection.commit()
+        return []
+
+    def save(self):
+        self.connection.commit()
+
+
+def migrate_json_to_sqlite(database_path=None):
+    """
+    One-shot copy of the JSON task file (snapshot plus journal) into a SQLite database.
+
+    Returns:
+        int: the number of tasks migrated
+    """
+    json_store = load_json_task_store()
+    sqlite_store = SqliteTaskStore(database_path or TASK_DATABASE_FILE)
+    sqlite_store.add_many(json_store.values())
+    sqlite_store.connection.execute(
+        "INSERT INTO meta (key, value) VALUES ('last_assigned_id', ?) "
+        "ON CONFLICT (key) DO UPDATE SET value = MAX(value, excluded.value)",
+        (json_store.last_assigned_id,))
+    sqlite_store.save()
+    return len(json_store)
+
+# --- Data Persistence Handlers ---
+
+def load_task_dictionary():
+    """
+    Opens the task collection with the configured storage backend
+    (TASK_STORAGE_BACKEND): the JSON file, fully loaded into a TaskStore, or a
+    SQLite database that is read lazily. Both map integer task IDs to Task records.
+    """
+    metrics = TASK_METRICS
+    started = time.perf_counter() if metrics is not None else 0.0
+    if TASK_STORAGE_BACKEND == "sqlite":
+        tasks = SqliteTaskStore(TASK_DATABASE_FILE)
+    else:
+        tasks = load_json_task_store()
+    if metrics is not None:
+        # The SQLite store reads tasks on demand, so only the JSON store loads any
+        metrics.record('load', started, tasks_loaded=len(tasks) if isinstance(tasks, TaskStore) else 0)
+    return tasks
 
 def save_task_dictionary(tasks):
-    """Saves the current dictionary of tasks and the next ID to the JSON file."""
-    data = {
-        'tasks': tasks,
-        'last_assigned_id': next_task_id - 1 # Store the last ID used
-    }
-    try:
-        with open(TASK_DATA_FILE, 'w') as file:
-            json.dump(data, file, indent=4)
-    except IOError as e:
-        print(f"[ERROR] Could not save task data: {e}")
+    """Persists the whole task collection (a JSON snapshot, or a SQLite commit)."""
+    metrics = TASK_METRICS
+    if metrics is None:
+        tasks.save()
+        return
+    started = time.perf_counter()
+    written = getattr(tasks, 'bytes_written', 0)
+    tasks.save()
+    metrics.record('save', started, bytes_written=getattr(tasks, 'bytes_written', 0) - written)
+
+def log_task_changes(tasks, records):
+    """
+    Persists a batch of edit records in one write (see TaskStore.log_changes).
+
+    Returns:
+        list: the records dropped because another process changed the same task first
+    """
+    metrics = TASK_METRICS
+    if metrics is None or not records:
+        return tasks.log_changes(records)
+    started = time.perf_counter()
+    written = getattr(tasks, 'bytes_written', 0)
+    conflicts = tasks.log_changes(records)
+    metrics.record('log_changes', started, records=len(records),
+                   bytes_written=getattr(tasks, 'bytes_written', 0) - written)
+    return conflicts
+
+def log_task_change(tasks, record):
+    """Persists one edit record (see log_task_changes). Returns True unless it was dropped as a conflict."""
+    return not log_task_changes(tasks, [record])
 
 # --- Task Management Logic ---
 
-def create_new_task(tasks):
-    """Prompts for task details and adds a new task dictionary to the main collection."""
-    global next_task_id
+def add_task(tasks, description, due_date="N/A", completed=False, task_id=None):
+    """
+    Adds a new Task to the collection (and its indexes), without saving.
+    `task_id` is an ID reserved earlier with allocate_ids; by default a new one is allocated.
+    
+    Returns:
+        Task: the newly created task
+    """
+    if task_id is None:
+        task_id = tasks.allocate_id()
+    new_task = Task(task_id, description, completed,
+                    created_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
+                    due_date=due_date if due_date else "N/A")
+    tasks.add(new_task)
+    return new_task
+
+
+def set_task_completion(tasks, task_id, completed=None):
+    """
+    Marks a task as complete or incomplete (flips it when `completed` is None),
+    without saving.
+    
+    Returns:
+        Task or None: the updated task, or None if no task has that ID
+    """
+    task = tasks.get(task_id)
+    if task is None:
+        return None
+    tasks.set_completed(task, (not task.completed) if completed is None else completed)
+    return task
+
+
+def remove_task(tasks, task_id):
+    """
+    Removes a task from the collection (and its indexes), without saving.
     
+    Returns:
+        Task or None: the removed task, or None if no task has that ID
+    """
+    return tasks.discard(task_id)
+
+
+def find_tasks(tasks, query):
+    """Returns the tasks matching a keyword query (see TaskSearchIndex.search), in ID order."""
+    metrics = TASK_METRICS
+    if metrics is None:
+        return tasks.search(query)
+    started = time.perf_counter()
+    matches = tasks.search(query)
+    # SQLite scans inside the full-text index; only the in-memory index can say how much
+    scanned = tasks.search_index.last_scanned if isinstance(tasks, TaskStore) else 0
+    metrics.record('search', started, matches=len(matches), tasks_scanned=scanned)
+    return matches
+
+
+def create_new_task(tasks):
+    """Prompts for task details and adds a new Task record to the main collection."""
     description = input("Enter new task description: ").strip()
     if not description:
         print("\n[ALERT] Task description cannot be empty.")
@@ -61,89 +1204,149 @@ def create_new_task(tasks):
 
     due_date = input("Enter due date (Optional, e.g., YYYY-MM-DD): ").strip()
     
-    # Create the detailed task object
-    task_id = str(next_task_id)
-    new_task = {
-        'id': task_id,
-        'description': description,
-        'completed': False,
-        'created_at': datetime.now().strftime("%Y-%m-%d %H:%M"),
-        'due_date': due_date if due_date else "N/A"
-    }
+    new_task = add_task(tasks, description, due_date)
+    log_task_change(tasks, {'op': 'put', 'task': new_task})
+    print(f"\n[SUCCESS] Task ID {new_task.id} added.")
+
 
-    tasks[task_id] = new_task
-    next_task_id += 1
-    save_task_dictionary(tasks)
-    print(f"\n[SUCCESS] Task ID {task_id} added.")
+def format_task_row(task):
+    """Formats one task as a row of the task table."""
+    status = " [DONE] " if task.completed else " [TODO] "
+    due = f"Due: {task.due_date}" if task.due_date != "N/A" else ""
+    return f"| {task.id:<3} {status} | {task.description:<35} | {due:<15}\n"
 
 
-def display_tasks(tasks, filter_status=None):
+def iter_task_rows(tasks, task_ids):
+    """Yields formatted table rows one at a time for the given IDs."""
+    for task in tasks.iter_tasks(task_ids):
+        yield format_task_row(task)
+
+
+def display_tasks(tasks, filter_status=None, due_before=None, page=0, page_size=DISPLAY_PAGE_SIZE):
     """
-    Displays tasks, optionally filtering by completion status, 
-    and sorts them by ID for a consistent view.
+    Displays one page of tasks in ID order, optionally filtering by completion status,
+    or only those due before a YYYY-MM-DD date (earliest due first).
+    Only the rows of the requested page are formatted, and the whole page is
+    written to the terminal in one go.
+
+    Returns:
+        int: the number of pages in this view
     """
     if not tasks:
         print("\n*** The To-Do Manager is empty! ***")
-        return
+        return 0
 
-    # Sort tasks by integer ID for consistent ordering
-    sorted_keys = sorted(tasks.keys(), key=lambda x: int(x))
-    
-    print("\n" + "="*60)
-    print("                 CURRENT TASK LIST")
-    print("="*60)
-    
-    found_tasks = False
-    
-    for task_id in sorted_keys:
-        task = tasks[task_id]
-        
-        # Apply filter if requested
-        if filter_status is None or task['completed'] == filter_status:
-            status = " [DONE] " if task['completed'] else " [TODO] "
-            due = f"Due: {task['due_date']}" if task['due_date'] != "N/A" else ""
-            
-            print(f"| {task_id:<3} {status} | {task['description']:<35} | {due:<15}")
-            found_tasks = True
+    metrics = TASK_METRICS
+    started = time.perf_counter() if metrics is not None else 0.0
+    task_ids = tasks.id_list(filter_status, due_before)
+    page_count = max(1, -(-len(task_ids) // page_size))
+    page = min(max(page, 0), page_count - 1)
+    start = page * page_size
+    window = task_ids[start:start + page_size]
 
-    if not found_tasks and filter_status is not None:
+    lines = ["\n" + "="*60 + "\n",
+             "                 CURRENT TASK LIST\n",
+             "="*60 + "\n"]
+    lines.extend(iter_task_rows(tasks, window))
+
+    if not window and due_before is not None:
+        lines.append(f"\nNo tasks due before {due_before}.\n")
+    elif not window and filter_status is not None:
         status_text = "COMPLETED" if filter_status else "INCOMPLETE"
-        print(f"\nNo {status_text} tasks found.")
-        
-    print("="*60 + "\n")
+        lines.append(f"\nNo {status_text} tasks found.\n")
+
+    if page_count > 1:
+        lines.append(f"-- Page {page + 1} of {page_count} "
+                     f"(tasks {start + 1}-{start + len(window)} of {len(task_ids)}) --\n")
+    lines.append("="*60 + "\n\n")
+    sys.stdout.write("".join(lines))
+    if metrics is not None:
+        metrics.record('display', started, tasks_scanned=len(window))
+    return page_count
+
+
+def browse_tasks(tasks, filter_status=None, due_before=None, page_size=DISPLAY_PAGE_SIZE):
+    """Shows a view page by page, with next/previous page and jump-to-ID navigation."""
+    page = 0
+    while True:
+        page_count = display_tasks(tasks, filter_status, due_before, page, page_size)
+        if page_count <= 1:
+            return
+
+        action = input("[N]ext, [P]revious, [J]ump to ID, [Q]uit paging: ").strip().upper()
+        if action == 'N':
+            page = min(page + 1, page_count - 1)
+        elif action == 'P':
+            page = max(page - 1, 0)
+        elif action == 'J':
+            target = input("Jump to Task ID: ").strip()
+            if not target.isdigit():
+                print("\n[ALERT] Task ID must be a number.")
+                continue
+            task_ids = tasks.id_list(filter_status, due_before)
+            if due_before is None:
+                # ID-ordered view: land on the page holding this ID (or the next one)
+                position = bisect.bisect_left(task_ids, int(target))
+            elif int(target) in task_ids:
+                position = task_ids.index(int(target))
+            else:
+                print(f"\n[ERROR] Task ID {target} is not in this view.")
+                continue
+            page = min(position, len(task_ids) - 1) // page_size
+        elif action == 'Q':
+            return
+        else:
+            print("\n[ALERT] Invalid paging option.")
+
+
+def export_tasks(tasks, output, filter_status=None, due_before=None):
+    """
+    Streams the rows of a view to an open text file (or sys.stdout).
+    Rows are generated one at a time, so the formatted output is never
+    held in memory as a whole.
+
+    Returns:
+        int: the number of tasks written
+    """
+    metrics = TASK_METRICS
+    started = time.perf_counter() if metrics is not None else 0.0
+    task_ids = tasks.id_list(filter_status, due_before)
+    output.writelines(iter_task_rows(tasks, task_ids))
+    if metrics is not None:
+        metrics.record('export', started, tasks_scanned=len(task_ids))
+    return len(task_ids)
 
 
 def toggle_task_completion(tasks):
     """Allows the user to mark a task as complete or incomplete."""
     task_id = input("Enter the Task ID to toggle status (e.g., 2): ").strip()
-    task = tasks.get(task_id)
+    task = set_task_completion(tasks, int(task_id)) if task_id.isdigit() else None
 
     if task:
-        task['completed'] = not task['completed']
-        status = "COMPLETE" if task['completed'] else "INCOMPLETE"
-        save_task_dictionary(tasks)
-        print(f"\n[SUCCESS] Task ID {task_id} ('{task['description']}') marked as {status}.")
+        status = "COMPLETE" if task.completed else "INCOMPLETE"
+        if log_task_change(tasks, {'op': 'put', 'task': task}):
+            print(f"\n[SUCCESS] Task ID {task_id} ('{task.description}') marked as {status}.")
     else:
         print(f"\n[ERROR] Task with ID {task_id} not found.")
 
 
 def search_tasks(tasks):
-    """Allows searching tasks by keyword in the description."""
-    keyword = input("Enter keyword to search for: ").strip().lower()
+    """
+    Allows searching tasks by keyword in the description.
+    Several keywords must all match; separate alternatives with OR.
+    """
+    keyword = input("Enter keyword(s) to search for (e.g., milk OR bread): ").strip()
     if not keyword:
         print("\n[ALERT] Search keyword cannot be empty.")
         return
 
-    found_tasks = []
-    for task_id, task in tasks.items():
-        if keyword in task['description'].lower():
-            found_tasks.append(task)
+    found_tasks = find_tasks(tasks, keyword)
 
     if found_tasks:
         print("\n--- SEARCH RESULTS ---")
         for task in found_tasks:
-            status = " [DONE] " if task['completed'] else " [TODO] "
-            print(f"ID {task['id']} {status} - {task['description']}")
+            status = " [DONE] " if task.completed else " [TODO] "
+            print(f"ID {task.id} {status} - {task.description}")
         print("----------------------")
     else:
         print(f"\nNo tasks found containing '{keyword}'.")
@@ -153,10 +1356,11 @@ def delete_task_by_id(tasks):
     """Deletes a task using its unique ID."""
     task_id = input("Enter the Task ID to DELETE: ").strip()
     
-    if task_id in tasks:
-        deleted_task = tasks.pop(task_id)
-        save_task_dictionary(tasks)
-        print(f"\n[SUCCESS] Task ID {task_id} ('{deleted_task['description']}') permanently deleted.")
+    deleted_task = remove_task(tasks, int(task_id)) if task_id.isdigit() else None
+
+    if deleted_task:
+        if log_task_change(tasks, {'op': 'delete', 'id': str(deleted_task.id)}):
+            print(f"\n[SUCCESS] Task ID {task_id} ('{deleted_task.description}') permanently deleted.")
     else:
         print(f"\n[ERROR] Task with ID {task_id} not found. Cannot delete.")
 
@@ -168,6 +1372,7 @@ def run_task_manager():
     tasks = load_task_dictionary() # Load existing tasks on startup
 
     while True:
+        tasks.refresh() # Pick up edits made by other processes
         display_tasks(tasks)
         
         print("\n--- Task Manager Menu ---")
@@ -175,7 +1380,7 @@ def run_task_manager():
         print("2. Toggle Status (C for Complete/I for Incomplete)")
         print("3. Delete Task (D)")
         print("4. Search Tasks (S)")
-        print("5. View Completed/Incomplete Tasks (V)")
+        print("5. View Completed/Incomplete/Due Tasks (V)")
         print("6. Exit and Save (E)")
         
         choice = input("Enter your choice (1-6 or letter code): ").strip().upper()
@@ -194,13 +1399,37 @@ def run_task_manager():
             
         elif choice in ('5', 'V'):
             print("\nView Options:")
+            print("  - Type 'A' to browse ALL tasks page by page.")
             print("  - Type 'D' to see only DONE tasks.")
             print("  - Type 'T' to see only TO-DO (incomplete) tasks.")
-            view_choice = input("Enter view option (D/T): ").strip().upper()
-            if view_choice == 'D':
-                display_tasks(tasks, filter_status=True)
+            print("  - Type 'B' to see tasks due BEFORE a date.")
+            print("  - Type 'X' to EXPORT all tasks to a file.")
+            view_choice = input("Enter view option (A/D/T/B/X): ").strip().upper()
+            if view_choice == 'A':
+                browse_tasks(tasks)
+            elif view_choice == 'D':
+                browse_tasks(tasks, filter_status=True)
             elif view_choice == 'T':
-                display_tasks(tasks, filter_status=False)
+                browse_tasks(tasks, filter_status=False)
+            elif view_choice == 'B':
+                due_before = input("Show tasks due before (YYYY-MM-DD): ").strip()
+                if date_to_ordinal(due_before) is not None:
+                    browse_tasks(tasks, due_before=due_before)
+                else:
+                    print("\n[ALERT] Please enter the date as YYYY-MM-DD.")
+            elif view_choice == 'X':
+                export_path = input("Export to file (or '-' for the screen): ").strip()
+                if export_path == '-':
+                    export_tasks(tasks, sys.stdout)
+                elif export_path:
+                    try:
+                        with open(export_path, 'w') as export_file:
+                            count = export_tasks(tasks, export_file)
+                        print(f"\n[SUCCESS] Exported {count} tasks to {export_path}.")
+                    except IOError as e:
+                        print(f"[ERROR] Could not export tasks: {e}")
+                else:
+                    print("\n[ALERT] Export file name cannot be empty.")
             else:
                 print("\n[ALERT] Invalid view option.")
         
@@ -217,5 +1446,194 @@ def run_task_manager():
             input("\nPress Enter to return to the main menu...")
 
 
+# --- Command-Line Interface (non-interactive / batch) ---
+
+def _read_task_ids(values):
+    """Yields task IDs from the command line, or streamed from stdin when none (or '-') are given."""
+    if not values or values == ['-']:
+        values = (token for line in sys.stdin for token in line.split())
+    for value in values:
+        if value.isdigit():
+            yield int(value)
+        else:
+            print(f"[ERROR] Invalid Task ID '{value}'.", file=sys.stderr)
+
+
+def _read_import_rows(source, file_format):
+    """
+    Streams task rows out of a CSV file (with a 'description' header column and
+    optional 'due_date'/'completed' columns) or a JSON Lines file with the same keys.
+    Raises ValueError for a file or row that isn't shaped like that.
+    """
+    if file_format == 'csv':
+        reader = csv.DictReader(source)
+        if 'description' not in (reader.fieldnames or ()):
+            raise ValueError("the CSV header has no 'description' column")
+        rows = ((reader.line_num, row) for row in reader)
+    else:
+        rows = ((number, json.loads(line)) for number, line in enumerate(source, start=1) if line.strip())
+    for number, row in rows:
+        if not isinstance(row, dict):
+            raise ValueError(f"line {number}: expected an object with a 'description' key")
+        for key in ('description', 'due_date'):
+            if row.get(key) is not None and not isinstance(row[key], str):
+                raise ValueError(f"line {number}: '{key}' must be a string")
+        yield row
+
+
+# Rows whose task IDs are reserved together during an import
+IMPORT_BATCH_ROWS = 1000
+
+def import_tasks(tasks, source, file_format):
+    """
+    Adds every row of an import stream to the collection in memory.
+    
+    Returns:
+        list: the journal records for the imported tasks
+    """
+    records = []
+    rows = (row for row in _read_import_rows(source, file_format) if (row.get('description') or "").strip())
+    while True:
+        # One lock round trip reserves the IDs for a whole batch of rows
+        batch = list(itertools.islice(rows, IMPORT_BATCH_ROWS))
+        if not batch:
+            return records
+        for task_id, row in zip(tasks.allocate_ids(len(batch)), batch):
+            completed = row.get('completed', False)
+            if isinstance(completed, str):
+                completed = completed.strip().lower() in ('1', 'true', 'yes', 'done')
+            new_task = add_task(tasks, row['description'].strip(), (row.get('due_date') or "N/A").strip(),
+                                bool(completed), task_id=task_id)
+            records.append({'op': 'put', 'task': new_task})
+
+
+def build_argument_parser():
+    parser = argparse.ArgumentParser(
+        description="Command-Line Task Manager. Run without a command for the interactive menu.")
+    parser.add_argument('--storage', choices=('json', 'sqlite'),
+                        help=f"storage backend (default: {TASK_STORAGE_BACKEND})")
+    parser.add_argument('--metrics', metavar='FILE',
+                        help="record load/save/search/display timings and write them as JSON "
+                             "to FILE on exit ('-' for stderr)")
+    commands = parser.add_subparsers(dest='command')
+
+    add_parser = commands.add_parser('add', help="add a task")
+    add_parser.add_argument('description')
+    add_parser.add_argument('--due', default="N/A", help="due date, e.g. YYYY-MM-DD")
+
+    list_parser = commands.add_parser('list', help="print tasks in ID order")
+    status_group = list_parser.add_mutually_exclusive_group()
+    status_group.add_argument('--done', dest='status', action='store_const', const=True)
+    status_group.add_argument('--todo', dest='status', action='store_const', const=False)
+    status_group.add_argument('--due-before', metavar='YYYY-MM-DD')
+
+    toggle_parser = commands.add_parser('toggle', help="flip the status of tasks")
+    toggle_parser.add_argument('ids', nargs='*', help="task IDs (read from stdin when omitted or '-')")
+    toggle_group = toggle_parser.add_mutually_exclusive_group()
+    toggle_group.add_argument('--done', dest='status', action='store_const', const=True,
+                              help="mark as complete instead of flipping")
+    toggle_group.add_argument('--todo', dest='status', action='store_const', const=False,
+                              help="mark as incomplete instead of flipping")
+
+    delete_parser = commands.add_parser('delete', help="delete tasks")
+    delete_parser.add_argument('ids', nargs='*', help="task IDs (read from stdin when omitted or '-')")
+
+    search_parser = commands.add_parser('search', help="search task descriptions")
+    search_parser.add_argument('query', help="keywords; separate alternatives with OR")
+
+    import_parser = commands.add_parser('import', help="bulk-add tasks from CSV or JSON Lines")
+    import_parser.add_argument('file', nargs='?', default='-', help="file to import (default: stdin)")
+    import_parser.add_argument('--format', choices=('csv', 'jsonl'),
+                               help="input format (default: from the file extension, else jsonl)")
+
+    commands.add_parser('migrate', help=f"copy {TASK_DATA_FILE} into the SQLite database {TASK_DATABASE_FILE}")
+    return parser
+
+
+def main(argv=None):
+    """
+    Runs one non-interactive command, or the interactive menu when none is given.
+    Batch commands apply every change in memory first and persist them in one write.
+    """
+    global TASK_STORAGE_BACKEND
+    args = build_argument_parser().parse_args(argv)
+    if args.storage:
+        TASK_STORAGE_BACKEND = args.storage
+    if args.metrics:
+        enable_metrics(args.metrics)
+
+    if args.command is None:
+        run_task_manager()
+        return 0
+
+    if args.command == 'migrate':
+        count = migrate_json_to_sqlite()
+        print(f"[SUCCESS] Migrated {count} task(s) to {TASK_DATABASE_FILE}. "
+              "Use --storage sqlite (or set TASK_STORAGE_BACKEND) to work with it.")
+        return 0
+
+    tasks = load_task_dictionary()
+    records = []
+    exit_code = 0
+
+    if args.command == 'add':
+        if not args.description.strip():
+            print("[ALERT] Task description cannot be empty.", file=sys.stderr)
+            return 2
+        new_task = add_task(tasks, args.description.strip(), args.due.strip())
+        records.append({'op': 'put', 'task': new_task})
+        print(f"[SUCCESS] Task ID {new_task.id} added.")
+
+    elif args.command == 'list':
+        if args.due_before is not None and date_to_ordinal(args.due_before) is None:
+            print("[ALERT] Please enter the date as YYYY-MM-DD.", file=sys.stderr)
+            return 2
+        try:
+            export_tasks(tasks, sys.stdout, args.status, args.due_before)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # The reader (e.g. `head`) stopped early; silence the final flush at exit
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+    elif args.command in ('toggle', 'delete'):
+        for task_id in _read_task_ids(args.ids):
+            if args.command == 'toggle':
+                task = set_task_completion(tasks, task_id, args.status)
+                record = {'op': 'put', 'task': task}
+            else:
+                task = remove_task(tasks, task_id)
+                record = {'op': 'delete', 'id': str(task_id)}
+            if task is None:
+                print(f"[ERROR] Task with ID {task_id} not found.", file=sys.stderr)
+                exit_code = 1
+            else:
+                records.append(record)
+
+    elif args.command == 'search':
+        for task in find_tasks(tasks, args.query):
+            status = " [DONE] " if task.completed else " [TODO] "
+            print(f"ID {task.id} {status} - {task.description}")
+
+    elif args.command == 'import':
+        file_format = args.format or ('csv' if args.file.lower().endswith('.csv') else 'jsonl')
+        try:
+            if args.file == '-':
+                records = import_tasks(tasks, sys.stdin, file_format)
+            else:
+                with open(args.file, 'r', newline='') as source:
+                    records = import_tasks(tasks, source, file_format)
+        except (IOError, ValueError, csv.Error) as e:  # ValueError includes json.JSONDecodeError
+            print(f"[ERROR] Import failed, nothing was saved: {e}", file=sys.stderr)
+            return 1
+        print(f"[SUCCESS] Imported {len(records)} task(s).")
+
+    conflicts = log_task_changes(tasks, records)
+    if args.command in ('toggle', 'delete'):
+        print(f"[SUCCESS] {len(records) - len(conflicts)} task(s) updated.")
+    if conflicts:
+        exit_code = 1
+    return exit_code
+
+
 if __name__ == "__main__":
-    run_task_manager()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+Expression engine benchmark: the compiled, cached engine vs. plain eval().
+
+Evaluates the same batch of mixed expressions through both paths. Most of
+the batch repeats a pool of recurring formulas (as real batch jobs do) and
+the rest is unique, so the numbers include both cache hits and misses.
+
+It then checks that inputs whose exact value would be astronomically large
+fail fast in every numeric mode: each runs in a child process, and the script
+exits with 1 if one is still running after HOSTILE_TIMEOUT seconds. Finally it
+checks that long expressions eval() accepts (sums of hundreds of terms, long
+runs of signs) evaluate to the same value in every mode.
+
+Usage:
+    python benchmarks/bench_calculator.py [--count 1000000] [--repeat-share 0.8]
+"""
+import argparse
+import os
+import random
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+import calculator  # noqa: E402
+
+TEMPLATES = [
+    "{a} + {b} * {c}",
+    "({a} - {b}) / {c}",
+    "{a} * ({b} + {c}) - {d} / 2",
+    "{a} ** 2 + {b} ** 0.5",
+    "sqrt({a}) + {b} % {c}",
+    "-{a} + ({b} // {c}) * {d}",
+    "max({a}, {b}, {c}) / ({d} + 1)",
+]
+
+
+# Powers that must be refused (float fallback, then OverflowError), not computed
+HOSTILE_EXPRESSIONS = ["9**9**9", "10**10**10", "(10**10000)**10000", "(2**100000)**(2**20)", "((7**99)**99)**99"]
+HOSTILE_TIMEOUT = 5.0
+
+# Long but ordinary expressions: the engine must nest no deeper than eval() does
+LONG_EXPRESSIONS = ["+".join(["1"] * 2000), "-" * 300 + "1", "/".join(["1"] * 500),
+                    "-".join(["1.5"] * 1000) + "*2%7", "(" * 150 + "1" + ")" * 150]
+
+
+def random_expression(rng):
+    template = rng.choice(TEMPLATES)
+    return template.format(**{name: rng.randint(1, 999) for name in "abcd"})
+
+
+def make_batch(count, repeat_share, seed=7):
+    rng = random.Random(seed)
+    recurring = [random_expression(rng) for _ in range(1000)]
+    return [rng.choice(recurring) if rng.random() < repeat_share else random_expression(rng)
+            for _ in range(count)]
+
+
+def time_path(evaluate, batch):
+    start = time.perf_counter()
+    for expression in batch:
+        try:
+            evaluate(expression)
+        except ZeroDivisionError:
+            pass
+    return time.perf_counter() - start
+
+
+def check_hostile_inputs():
+    """Evaluates every hostile input in every mode; returns False if one hangs."""
+    passed = True
+    for expression in HOSTILE_EXPRESSIONS:
+        for mode in calculator.NUMERIC_MODES:
+            code = f"import calculator; print(calculator.calculation_message({expression!r}, {mode!r}))"
+            start = time.perf_counter()
+            try:
+                process = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True,
+                                         text=True, timeout=HOSTILE_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                print(f"  [ERROR] {expression} ({mode}) still running after {HOSTILE_TIMEOUT:.0f}s")
+                passed = False
+                continue
+            outcome = (process.stdout.strip() or process.stderr.strip().splitlines()[-1])[:60]
+            print(f"  {expression:22s} {mode:8s} {time.perf_counter() - start:5.2f}s  {outcome}")
+    return passed
+
+
+def check_long_inputs():
+    """Evaluates every long input in every mode; returns False if one fails or disagrees with eval()."""
+    passed = True
+    for expression in LONG_EXPRESSIONS:
+        expected = eval(expression, dict(calculator.EVAL_NAMESPACE))
+        for mode in calculator.NUMERIC_MODES:
+            result, error = calculator.calculate(expression, mode)
+            if error is not None or float(result) != expected:
+                print(f"  [ERROR] {expression[:20]}... ({mode}): {error or result}")
+                passed = False
+    if passed:
+        print(f"  {len(LONG_EXPRESSIONS)} expressions agree with eval() in every mode")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000, help="expressions in the batch (default: 1M)")
+    parser.add_argument("--repeat-share", type=float, default=0.8,
+                        help="fraction of the batch drawn from 1000 recurring formulas (default: 0.8)")
+    args = parser.parse_args()
+
+    batch = make_batch(args.count, args.repeat_share)
+    namespace = dict(calculator.EVAL_NAMESPACE)
+    eval_time = time_path(lambda expression: eval(expression, namespace), batch)
+    calculator.compile_expression.cache_clear()
+    engine_time = time_path(calculator.evaluate_expression, batch)
+    cache = calculator.compile_expression.cache_info()
+
+    print(f"{args.count:,} expressions ({args.repeat_share:.0%} recurring)")
+    print(f"  eval():            {eval_time:8.2f}s  {args.count / eval_time:12,.0f} expr/s")
+    print(f"  expression engine: {engine_time:8.2f}s  {args.count / engine_time:12,.0f} expr/s"
+          f"  ({eval_time / engine_time:.1f}x)")
+    print(f"  compile cache: {cache.hits:,} hits, {cache.misses:,} misses")
+
+    print("Hostile inputs:")
+    passed = check_hostile_inputs()
+    print("Long inputs:")
+    if not (check_long_inputs() and passed):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
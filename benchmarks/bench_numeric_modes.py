@@ -0,0 +1,52 @@
+"""
+Numeric mode benchmark: per-expression cost of float, decimal and fraction mode.
+
+Evaluates the same mixed batch as bench_calculator.py in every numeric mode
+(with a warm compile cache, so the numbers are the arithmetic itself) and
+reports the average cost per expression relative to float mode.
+
+Usage:
+    python benchmarks/bench_numeric_modes.py [--count 200000] [--precision 28]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import calculator  # noqa: E402
+from bench_calculator import make_batch  # noqa: E402
+
+
+def time_mode(batch, mode, precision):
+    for expression in set(batch):
+        calculator.calculate(expression, mode, precision)  # warm the compile cache
+    start = time.perf_counter()
+    for expression in batch:
+        calculator.calculate(expression, mode, precision)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=200_000, help="expressions in the batch (default: 200k)")
+    parser.add_argument("--precision", type=int, default=calculator.DECIMAL_PRECISION,
+                        help=f"decimal mode precision (default: {calculator.DECIMAL_PRECISION})")
+    args = parser.parse_args()
+
+    # Recurring formulas only, so every mode runs from a warm cache
+    batch = make_batch(args.count, repeat_share=1.0)
+    calculator.compile_expression.cache_clear()
+    print(f"{args.count:,} expressions, decimal precision {args.precision}")
+
+    float_time = None
+    for mode in calculator.NUMERIC_MODES:
+        elapsed = time_mode(batch, mode, args.precision)
+        float_time = float_time or elapsed
+        print(f"  {mode:8s}: {elapsed:7.2f}s  {elapsed / args.count * 1e6:8.2f} us/expr"
+              f"  ({elapsed / float_time:.1f}x float)")
+
+
+if __name__ == "__main__":
+    main()
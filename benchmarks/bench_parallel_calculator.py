@@ -0,0 +1,62 @@
+"""
+Parallel batch evaluation benchmark: evaluate_batch scaling from 1 to N workers.
+
+Runs the same mixed batch as bench_calculator.py through evaluate_batch with
+an increasing number of worker processes and reports throughput and speedup
+over a single worker. Results are checked against the single-worker run.
+
+Usage:
+    python benchmarks/bench_parallel_calculator.py [--count 1000000] [--max-workers N] [--chunk-size 2000]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import calculator  # noqa: E402
+from bench_calculator import make_batch  # noqa: E402
+
+
+def worker_counts(max_workers):
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000, help="expressions in the batch (default: 1M)")
+    parser.add_argument("--repeat-share", type=float, default=0.8,
+                        help="fraction of the batch drawn from 1000 recurring formulas (default: 0.8)")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1,
+                        help="largest worker count to try (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=calculator.BATCH_CHUNK_SIZE,
+                        help=f"expressions per worker task (default: {calculator.BATCH_CHUNK_SIZE})")
+    args = parser.parse_args()
+
+    batch = make_batch(args.count, args.repeat_share)
+    print(f"{args.count:,} expressions ({args.repeat_share:.0%} recurring), "
+          f"chunks of {args.chunk_size:,}, {os.cpu_count()} cores")
+
+    baseline_time = baseline = None
+    for workers in worker_counts(args.max_workers):
+        calculator.compile_expression.cache_clear()
+        start = time.perf_counter()
+        results = list(calculator.evaluate_batch(batch, workers=workers, chunk_size=args.chunk_size))
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline_time, baseline = elapsed, results
+        elif results != baseline:
+            print(f"  [ERROR] {workers} workers returned different results than 1 worker")
+            sys.exit(1)
+        print(f"  {workers:3d} workers: {elapsed:8.2f}s  {args.count / elapsed:12,.0f} expr/s"
+              f"  ({baseline_time / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
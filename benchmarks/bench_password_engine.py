@@ -0,0 +1,89 @@
+"""
+Password engine benchmark and uniformity check.
+
+Times PasswordEngine.generate for a large batch (1M passwords by default) and
+runs chi-square tests on the output:
+  * the raw character stream must be uniform over the whole pool
+  * inside every character type, each character must be equally likely
+  * every position of the password must be uniform over the pool's types
+The tests fail (exit code 1) if a statistic exceeds the critical value at the
+chosen significance level.
+
+Usage:
+    python benchmarks/bench_password_engine.py [--count 1000000] [--length 14] [--alpha 0.001]
+"""
+import argparse
+import math
+import os
+import sys
+import time
+from collections import Counter
+from statistics import NormalDist
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from password_engine import PasswordEngine  # noqa: E402
+
+
+def chi_square(counts, expected):
+    return sum((observed - expected) ** 2 / expected for observed in counts)
+
+
+def critical_value(degrees, alpha):
+    """Upper chi-square critical value (Wilson-Hilferty approximation)."""
+    z = NormalDist().inv_cdf(1 - alpha)
+    factor = 2 / (9 * degrees)
+    return degrees * (1 - factor + z * math.sqrt(factor)) ** 3
+
+
+def check(name, counts, expected, alpha):
+    degrees = len(counts) - 1
+    if degrees < 1:
+        return True
+    statistic = chi_square(counts, expected)
+    limit = critical_value(degrees, alpha)
+    passed = statistic <= limit
+    print(f"  {'[SUCCESS]' if passed else '[ERROR]'} {name}: chi2 = {statistic:.1f} "
+          f"(df {degrees}, critical {limit:.1f})")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000, help="passwords to generate (default: 1M)")
+    parser.add_argument("--length", type=int, default=14, help="password length (default: 14)")
+    parser.add_argument("--alpha", type=float, default=0.001, help="significance level (default: 0.001)")
+    args = parser.parse_args()
+
+    engine = PasswordEngine(length=args.length)
+    start = time.perf_counter()
+    passwords = engine.generate(args.count)
+    elapsed = time.perf_counter() - start
+    print(f"{args.count:,} passwords of length {args.length} from a pool of {len(engine.pool)}: "
+          f"{elapsed:.2f}s ({args.count / elapsed:,.0f} passwords/s)")
+
+    print("Uniformity:")
+    passed = True
+
+    stream = Counter(engine.random_chars(len(engine.pool) * 10_000).decode("ascii"))
+    passed &= check("raw character stream", [stream[c] for c in engine.pool], 10_000, args.alpha)
+
+    totals = Counter()
+    for password in passwords:
+        totals.update(password)
+    for chars in engine.classes:
+        counts = [totals[c] for c in chars]
+        passed &= check(f"within {chars[:3]}...", counts, sum(counts) / len(chars), args.alpha)
+
+    # Which type sits at a position must not depend on the position
+    type_of = {c: index for index, chars in enumerate(engine.classes) for c in chars}
+    by_position = [Counter(type_of[password[i]] for password in passwords) for i in range(args.length)]
+    for index, chars in enumerate(engine.classes):
+        counts = [position[index] for position in by_position]
+        passed &= check(f"position of {chars[:3]}...", counts, sum(counts) / args.length, args.alpha)
+
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Password strength estimator benchmark.
+
+Scores a large batch with estimate_strengths(): mostly generated passwords
+plus a share of weak, human-style ones (dictionary words with digits,
+keyboard walks, repeats). Reports throughput in passwords per minute and the
+label distribution.
+
+Usage:
+    python benchmarks/bench_password_strength.py [--count 1000000] [--weak-share 0.3]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import password_strength  # noqa: E402
+from password_engine import PasswordEngine  # noqa: E402
+
+WEAK_TEMPLATES = ["{word}{number}", "{Word}{number}!", "{word}{word2}", "qwerty{number}",
+                  "{word}{word}", "aaaa{number}", "123{word}"]
+
+
+def make_batch(count, weak_share, seed=11):
+    rng = random.Random(seed)
+    with open(password_strength.WORDLIST_FILE) as file:
+        words = [line.strip() for line in file if line.strip() and not line.startswith("#")]
+    engine = PasswordEngine(length=12)
+    strong = iter(engine.generate(count))
+    batch = []
+    for _ in range(count):
+        if rng.random() < weak_share:
+            word, word2 = rng.choice(words), rng.choice(words)
+            batch.append(rng.choice(WEAK_TEMPLATES).format(
+                word=word, Word=word.capitalize(), word2=word2, number=rng.randint(0, 9999)))
+        else:
+            batch.append(next(strong))
+    return batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000, help="passwords to score (default: 1M)")
+    parser.add_argument("--weak-share", type=float, default=0.3,
+                        help="fraction of human-style weak passwords (default: 0.3)")
+    args = parser.parse_args()
+
+    batch = make_batch(args.count, args.weak_share)
+    password_strength.get_estimator()  # load the wordlist outside the timing
+
+    start = time.perf_counter()
+    results = password_strength.estimate_strengths(batch)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.count:,} passwords ({args.weak_share:.0%} human-style): {elapsed:.2f}s, "
+          f"{args.count / elapsed * 60 / 1e6:.1f}M passwords/minute")
+    labels = Counter(label for _, label in results)
+    for _, label, _ in password_strength.STRENGTH_LEVELS:
+        print(f"  {label:10s} {labels[label]:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Startup benchmark for the password generator: headless vs. GUI import cost.
+
+Runs each scenario in a fresh interpreter with `python -X importtime` and
+reports the median total import time (sum of the top-level imports) and
+wall-clock time. Headless scenarios fail (exit code 1) if they pull in any
+GUI module. The GUI scenario is skipped when CustomTkinter isn't installed.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+GUI_MODULES = ("customtkinter", "tkinter", "pyperclip")
+
+SCENARIOS = [
+    ("engine import", ["-c", "import password_engine"], True),
+    ("strength rating import", ["-c", "from passwordgen import get_strength_rating"], True),
+    ("CLI, 1 password", ["password_engine.py", "-n", "1"], True),
+    ("GUI class load", ["-c", "import passwordgen; passwordgen.load_gui()"], False),
+]
+
+
+def run_once(arguments):
+    """Returns (import microseconds, wall seconds, imported module names), or None if the run failed."""
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, "-X", "importtime", *arguments], cwd=ROOT,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    wall = time.perf_counter() - start
+    if process.returncode != 0:
+        return None
+    total = 0
+    modules = set()
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.add(name.strip())
+        if not name.startswith("  "):  # top-level import; nested ones are in its cumulative time
+            total += int(cumulative)
+    return total, wall, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per scenario (default: 5)")
+    args = parser.parse_args()
+
+    passed = True
+    for name, arguments, headless in SCENARIOS:
+        runs = [run_once(arguments) for _ in range(args.repeat)]
+        if None in runs:
+            print(f"  {name:24s} skipped (failed to run; is CustomTkinter installed?)")
+            continue
+        imports = statistics.median(run[0] for run in runs) / 1000
+        wall = statistics.median(run[1] for run in runs) * 1000
+        gui_loaded = sorted(set(GUI_MODULES) & runs[0][2])
+        print(f"  {name:24s} imports {imports:7.1f} ms   wall {wall:7.1f} ms"
+              + (f"   GUI modules: {', '.join(gui_loaded)}" if gui_loaded else ""))
+        if headless and gui_loaded:
+            print(f"  [ERROR] {name} should not import {', '.join(gui_loaded)}")
+            passed = False
+
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Memory benchmark: plain task dictionaries vs. compact Task records.
+
+Builds the same synthetic task store twice -- once in the original layout
+(string ID keys, one dict per task, dates as text) and once as Task records
+keyed by int -- and reports the memory each one holds, measured with tracemalloc.
+
+Usage:
+    python benchmarks/bench_task_memory.py [--count 1000000]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Task_1_ToDoList"))
+import todo_list  # noqa: E402
+
+WORDS = ["buy", "milk", "write", "report", "call", "mom", "fix", "bug", "review",
+         "pull", "request", "book", "flight", "pay", "rent", "clean", "kitchen"]
+
+
+def synthetic_records(count, seed=42):
+    """Yields task dictionaries in the JSON file layout, like json.load produces them."""
+    rng = random.Random(seed)
+    for task_id in range(1, count + 1):
+        # join() builds a fresh string each time, just as the JSON parser does
+        description = " ".join(rng.choice(WORDS) for _ in range(3))
+        due_date = f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" if rng.random() < 0.6 else "N/A"
+        yield {
+            'id': str(task_id),
+            'description': description,
+            'completed': rng.random() < 0.3,
+            'created_at': f"2025-01-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}",
+            'due_date': due_date
+        }
+
+
+def measure(build, count):
+    """Returns (store, bytes held by the store) for the given builder."""
+    gc.collect()
+    tracemalloc.start()
+    store = build(count)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return store, current
+
+
+def build_dict_store(count):
+    return {record['id']: record for record in synthetic_records(count)}
+
+
+def build_task_store(count):
+    return {task.id: task for task in map(todo_list.Task.from_record, synthetic_records(count))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000, help="number of tasks (default: 1M)")
+    args = parser.parse_args()
+
+    results = []
+    for name, build in (("dict records", build_dict_store), ("Task records", build_task_store)):
+        store, used = measure(build, args.count)
+        results.append((name, used))
+        del store
+
+    print(f"Task store memory at {args.count:,} tasks")
+    for name, used in results:
+        print(f"  {name:<14} {used / 2**20:9.1f} MiB  ({used / args.count:6.1f} bytes/task)")
+    baseline = results[0][1]
+    print(f"  saving: {100 * (1 - results[1][1] / baseline):.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Search latency benchmark for the task manager's keyword index.
+
+Builds the run_suite synthetic store (descriptions of 2-5 common words plus
+the task's ID, so the vocabulary is as large as the store) and times a mix of
+queries, both at the index level (TaskSearchIndex.search, the matching IDs)
+and through find_tasks (the matching Task records in ID order).
+
+Selective queries (up to SELECTIVE_MATCHES results) must stay under the
+latency target in both; the script exits with 1 if one doesn't. Broad queries
+are bound by the number of records they return, so for those the time per
+match is reported instead.
+
+Usage:
+    python benchmarks/bench_task_search.py [--count 500000] [--target-ms 1.0]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Task_1_ToDoList"))
+import todo_list  # noqa: E402
+from run_suite import make_tasks  # noqa: E402
+
+SELECTIVE_MATCHES = 1000
+
+QUERIES = [
+    "250000",              # one task, by the ID in its description
+    "milk 250000",         # AND with a rare term
+    "2500",                # substring of a few hundred ID words
+    "12345 OR 54321",      # OR of rare terms
+    "xyzzy",               # no match
+    "zq",                  # short fragment, no match
+    "milk",                # broad: whole word
+    "ilk",                 # broad: fragment
+    "mi",                  # broad: short fragment at the start of a word
+    "lk",                  # broad: short fragment at the end of a word
+    "milk bread",          # broad AND
+    "milk OR eggs",        # broad OR
+]
+
+
+def median_ms(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=500_000, help="tasks in the store (default: 500k)")
+    parser.add_argument("--target-ms", type=float, default=1.0, help="latency target for selective queries")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per query (default: 20)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    store = todo_list.TaskStore(make_tasks(args.count), args.count)
+    index = store.search_index
+    print(f"{args.count:,} tasks, {len(index.postings):,} distinct words, "
+          f"indexed in {time.perf_counter() - start:.1f}s\n")
+
+    print(f"{'query':18s} {'matches':>8s} {'first ms':>9s} {'index ms':>9s} {'find ms':>9s}")
+    passed = True
+    for query in QUERIES:
+        start = time.perf_counter()
+        matches = len(index.search(query))  # first run: keyword expansions not cached yet
+        first = (time.perf_counter() - start) * 1000
+        index_ms = median_ms(lambda: index.search(query), args.repeat)
+        find_ms = median_ms(lambda: todo_list.find_tasks(store, query), args.repeat)
+        line = f"{query:18s} {matches:>8,} {first:9.3f} {index_ms:9.3f} {find_ms:9.3f}"
+        if matches > SELECTIVE_MATCHES:
+            line += f"   broad: {find_ms * 1000 / matches:.2f} us per match"
+        elif max(first, index_ms, find_ms) > args.target_ms:
+            line += f"   [ERROR] over the {args.target_ms} ms target"
+            passed = False
+        print(line)
+
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""
+Benchmark and profiling suite for the to-do manager, calculator and password generator.
+
+Every case builds its own synthetic data (task stores from 1k to 1M tasks,
+expression and conversion batches, password batches) and then times one hot
+path headlessly. Each case runs in a fresh interpreter, so its peak RSS is its
+own. Optionally it is wrapped in tracemalloc (peak Python heap of the timed
+part) or cProfile (a .prof file per case plus the top functions).
+
+Results are saved as JSON under --output. Pass an earlier file to --compare to
+see the throughput change per case.
+
+Usage:
+    python benchmarks/run_suite.py [--quick] [--only todo,calc,password]
+                                   [--tracemalloc] [--profile] [--compare OLD.json]
+"""
+import argparse
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, BENCHMARK_DIR)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "Task_1_ToDoList"))
+
+try:
+    import resource
+except ImportError:
+    # Windows: peak RSS is not reported
+    resource = None
+
+TASK_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+BATCH_SIZES = [100_000]
+QUICK_TASK_SIZES = [1_000, 10_000]
+QUICK_BATCH_SIZES = [10_000]
+
+# --- Synthetic Data ---
+
+TASK_WORDS = ("buy milk bread eggs call mom dentist report invoice email review "
+              "draft plan meeting budget slides deploy fix bug test release clean "
+              "garage book flight hotel pay rent renew passport gym laundry").split()
+
+
+def make_tasks(count, seed=3):
+    """Returns `count` Task records with random descriptions, statuses and due dates."""
+    import todo_list
+    rng = random.Random(seed)
+    tasks = {}
+    for task_id in range(1, count + 1):
+        description = " ".join(rng.choice(TASK_WORDS) for _ in range(rng.randint(2, 5)))
+        due = f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" if rng.random() < 0.4 else "N/A"
+        tasks[task_id] = todo_list.Task(task_id, f"{description} {task_id}", rng.random() < 0.3,
+                                        "2025-01-01 09:00", due)
+    return tasks
+
+
+def make_task_store(count, backend):
+    """Writes a synthetic store with `count` tasks in the current directory and opens it."""
+    import todo_list
+    todo_list.TASK_STORAGE_BACKEND = backend
+    store = todo_list.TaskStore(make_tasks(count), count)
+    store.save()
+    if backend == "sqlite":
+        todo_list.migrate_json_to_sqlite()
+        os.remove(todo_list.TASK_DATA_FILE)
+    return todo_list.load_task_dictionary()
+
+
+def make_conversions(count, seed=5):
+    import calculator
+    rng = random.Random(seed)
+    requests = []
+    for _ in range(count):
+        category = rng.choice(calculator.UNIT_REGISTRY.categories())
+        units = calculator.UNIT_REGISTRY.units(category)
+        requests.append((category, str(rng.uniform(-100, 1000)), rng.choice(units), rng.choice(units)))
+    return requests
+
+
+# --- Cases ---
+# Each case is set up with a size and returns a run() callable; run() does the
+# timed work and returns the number of items it processed.
+
+CASES = {}
+
+
+def case(name, group, sizes, quick_sizes):
+    def register(setup):
+        CASES[name] = {"group": group, "setup": setup, "sizes": sizes, "quick_sizes": quick_sizes}
+        return setup
+    return register
+
+
+def _todo_cases(backend):
+    # The SQLite store is read lazily and written through, so its load and
+    # save are near-constant; its costs show up in search, display and export.
+    prefix = f"todo.{backend}"
+
+    @case(f"{prefix}.load", "todo", TASK_SIZES, QUICK_TASK_SIZES)
+    def load(size):
+        import todo_list
+        make_task_store(size, backend)
+        return lambda: len(todo_list.load_task_dictionary()) and size
+
+    @case(f"{prefix}.save", "todo", TASK_SIZES, QUICK_TASK_SIZES)
+    def save(size):
+        import todo_list
+        tasks = make_task_store(size, backend)
+        return lambda: todo_list.save_task_dictionary(tasks) or size
+
+    @case(f"{prefix}.search", "todo", TASK_SIZES, QUICK_TASK_SIZES)
+    def search(size):
+        import todo_list
+        tasks = make_task_store(size, backend)
+        rng = random.Random(9)
+        queries = [" ".join(rng.sample(TASK_WORDS, rng.randint(1, 2))) for _ in range(200)]
+        queries += [f"{rng.choice(TASK_WORDS)} OR {rng.choice(TASK_WORDS)}" for _ in range(50)]
+        queries += [rng.choice(TASK_WORDS)[:3] for _ in range(50)]  # substring matches
+
+        def run():
+            for query in queries:
+                todo_list.find_tasks(tasks, query)
+            return len(queries)
+        return run
+
+    @case(f"{prefix}.log_change", "todo", TASK_SIZES, QUICK_TASK_SIZES)
+    def log_change(size):
+        import todo_list
+        tasks = make_task_store(size, backend)
+
+        def run():
+            for number in range(500):
+                task = todo_list.add_task(tasks, f"new task {number}")
+                todo_list.log_task_change(tasks, {'op': 'put', 'task': task})
+            return 500
+        return run
+
+    @case(f"{prefix}.display_page", "todo", TASK_SIZES, QUICK_TASK_SIZES)
+    def display_page(size):
+        import todo_list
+        tasks = make_task_store(size, backend)
+
+        def run():
+            for page in range(0, 200, 4):
+                todo_list.display_tasks(tasks, page=page)
+                todo_list.display_tasks(tasks, filter_status=False, page=page)
+            return 100
+        return run
+
+    @case(f"{prefix}.export", "todo", TASK_SIZES, QUICK_TASK_SIZES)
+    def export(size):
+        import todo_list
+        tasks = make_task_store(size, backend)
+
+        def run():
+            with open(os.devnull, 'w') as output:
+                return todo_list.export_tasks(tasks, output)
+        return run
+
+
+_todo_cases("json")
+_todo_cases("sqlite")
+
+
+@case("calc.standard", "calc", BATCH_SIZES, QUICK_BATCH_SIZES)
+def calc_standard(size):
+    import calculator
+    from bench_calculator import make_batch
+    batch = make_batch(size, repeat_share=0.8)
+
+    def run():
+        for expression in batch:
+            calculator.calculation_message(expression)
+        return size
+    return run
+
+
+@case("calc.convert", "calc", BATCH_SIZES, QUICK_BATCH_SIZES)
+def calc_convert(size):
+    import calculator
+    requests = make_conversions(size)
+
+    def run():
+        for category, value, from_unit, to_unit in requests:
+            calculator.conversion_message(category, value, from_unit, to_unit)
+        return size
+    return run
+
+
+@case("calc.convert_many", "calc", [1_000_000], [100_000])
+def calc_convert_many(size):
+    import calculator
+    values = [random.Random(6).uniform(-50, 50) for _ in range(size)]
+    return lambda: len(calculator.convert_many(values, "TEMPERATURE", "CELSIUS", "FAHRENHEIT"))
+
+
+@case("calc.stream", "calc", BATCH_SIZES, QUICK_BATCH_SIZES)
+def calc_stream(size):
+    import calculator
+    from bench_calculator import make_batch
+    text = "\n".join(make_batch(size, repeat_share=0.8)) + "\n"
+
+    def run():
+        with open(os.devnull, 'w') as output:
+            return calculator.stream_lines(io.StringIO(text), output)
+    return run
+
+
+@case("password.generate_bulk", "password", [1_000_000], [100_000])
+def password_generate_bulk(size):
+    from password_engine import PasswordEngine
+    engine = PasswordEngine()
+    return lambda: len(engine.generate(size))
+
+
+@case("password.generate_single", "password", BATCH_SIZES, QUICK_BATCH_SIZES)
+def password_generate_single(size):
+    # The GUI path: one password per _generate_password call
+    from password_engine import PasswordEngine
+    engine = PasswordEngine()
+
+    def run():
+        for _ in range(size):
+            engine.generate_password()
+        return size
+    return run
+
+
+@case("password.strength", "password", BATCH_SIZES, QUICK_BATCH_SIZES)
+def password_strength_batch(size):
+    import password_strength
+    from bench_password_strength import make_batch
+    batch = make_batch(size, weak_share=0.3)
+    password_strength.get_estimator()
+    return lambda: len(password_strength.estimate_strengths(batch))
+
+
+@case("password.history_unique", "password", [20_000], [2_000])
+def password_history_unique(size):
+    from password_engine import PasswordEngine, write_passwords
+    from password_history import PasswordHistory
+    engine = PasswordEngine()
+    history = PasswordHistory("password_history.txt")
+
+    def run():
+        with open(os.devnull, 'w') as output:
+            write_passwords(engine, size, output, history, unique=True)
+        history.close()
+        return size
+    return run
+
+
+# --- Running ---
+
+def peak_rss_bytes():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # kilobytes everywhere but macOS
+
+
+def run_case(name, size, trace_memory, profile_path):
+    """Runs one case in this process (called in the child) and returns its result dict."""
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        run = CASES[name]["setup"](size)
+        if trace_memory:
+            tracemalloc.start()
+        profiler = cProfile.Profile() if profile_path else None
+        start = time.perf_counter()
+        if profiler:
+            items = profiler.runcall(run)
+        else:
+            items = run()
+        elapsed = time.perf_counter() - start
+        result = {"case": name, "size": size, "seconds": elapsed, "items": items,
+                  "items_per_second": items / elapsed if elapsed else None,
+                  "peak_rss_bytes": peak_rss_bytes()}
+        if trace_memory:
+            result["traced_peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        if profiler:
+            profiler.dump_stats(profile_path)
+            summary = io.StringIO()
+            pstats.Stats(profile_path, stream=summary).sort_stats("cumulative").print_stats(8)
+            result["profile"] = profile_path
+            result["profile_top"] = summary.getvalue()
+        os.chdir(ROOT)
+    return result
+
+
+def run_in_child(name, size, args):
+    command = [sys.executable, os.path.abspath(__file__), "--run-case", name, "--size", str(size)]
+    if args.tracemalloc:
+        command.append("--tracemalloc")
+    if args.profile:
+        profile_dir = os.path.join(os.path.abspath(args.output), "profiles")
+        os.makedirs(profile_dir, exist_ok=True)
+        command += ["--profile-path", os.path.join(profile_dir, f"{name}-{size}.prof")]
+    process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    if process.returncode != 0:
+        return {"case": name, "size": size, "error": process.stderr.strip().splitlines()[-1:]}
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def format_bytes(value):
+    return f"{value / 2**20:8.1f}" if value is not None else "       -"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--quick", action="store_true", help="small sizes only (a smoke run)")
+    parser.add_argument("--only", help="comma-separated groups or case names (todo, calc, password, ...)")
+    parser.add_argument("--tracemalloc", action="store_true", help="also report the traced Python heap peak")
+    parser.add_argument("--profile", action="store_true", help="write a cProfile .prof file per case (slows the timings)")
+    parser.add_argument("--output", default=os.path.join(BENCHMARK_DIR, "results"),
+                        help="directory for the JSON results (default: benchmarks/results)")
+    parser.add_argument("--compare", help="earlier results file to compare throughput against")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    parser.add_argument("--size", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--profile-path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        # Child process: keep the tools' own output off the result line
+        real_stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+        result = run_case(args.run_case, args.size, args.tracemalloc, args.profile_path)
+        real_stdout.write(json.dumps(result) + "\n")
+        return
+
+    selected = set(args.only.split(",")) if args.only else None
+    previous = {}
+    if args.compare:
+        with open(args.compare) as file:
+            previous = {(r["case"], r["size"]): r for r in json.load(file)["results"] if "error" not in r}
+
+    results = []
+    print(f"{'case':28s} {'size':>10s} {'seconds':>9s} {'items/s':>13s} {'RSS MiB':>8s} {'heap MiB':>8s}")
+    for name, spec in CASES.items():
+        if selected and spec["group"] not in selected and name not in selected:
+            continue
+        for size in spec["quick_sizes"] if args.quick else spec["sizes"]:
+            result = run_in_child(name, size, args)
+            results.append(result)
+            if "error" in result:
+                print(f"{name:28s} {size:>10,} [ERROR] {' '.join(result['error'])}")
+                continue
+            line = (f"{name:28s} {size:>10,} {result['seconds']:9.3f} {result['items_per_second']:13,.0f} "
+                    f"{format_bytes(result['peak_rss_bytes'])} {format_bytes(result.get('traced_peak_bytes'))}")
+            earlier = previous.get((name, size))
+            if earlier:
+                line += f"  {result['items_per_second'] / earlier['items_per_second']:5.2f}x vs before"
+            print(line)
+
+    os.makedirs(args.output, exist_ok=True)
+    path = os.path.join(args.output, f"suite-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    with open(path, 'w') as file:
+        json.dump({"created": datetime.now().isoformat(timespec="seconds"), "revision": git_revision(),
+                   "python": platform.python_version(), "platform": platform.platform(),
+                   "cpus": os.cpu_count(), "quick": args.quick, "results": results}, file, indent=2)
+    print(f"\n[SUCCESS] Results saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Multi-process stress test for the JSON task store.
+
+Starts several worker processes that all hammer the same task files with
+adds, toggles and deletes, then reloads the store and checks that no write
+was lost: every task a worker added and did not delete is present with the
+status it last set, every deleted task is gone, and no ID was handed out twice.
+A small JOURNAL_COMPACT_BYTES makes the workers compact (and so race on
+snapshots) regularly.
+
+Part of the operations flip or delete a set of shared tasks that every worker
+sees, usually from a stale copy. Edits that raced with another worker must be
+reported as conflicts, and the accepted ones must add up: a shared task that an
+accepted delete removed stays gone, and the others show exactly as many status
+flips (and versions) as were accepted.
+
+Usage:
+    python benchmarks/stress_task_store.py [--workers 8] [--ops 300] [--shared 20]
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Task_1_ToDoList"))
+import todo_list  # noqa: E402
+
+
+# Longest pause between editing a shared task and logging the edit, so other
+# workers get to change it in between even on a single core
+STALE_WINDOW = 0.002
+
+
+def worker(worker_number, operations, data_dir, compact_bytes, shared_ids, results):
+    os.chdir(data_dir)
+    sys.stdout = open(os.devnull, 'w')  # conflict alerts are expected here
+    todo_list.JOURNAL_COMPACT_BYTES = compact_bytes
+    rng = random.Random(worker_number)
+    tasks = todo_list.load_task_dictionary()
+
+    added = []          # IDs this worker created, in order
+    live = {}           # ID -> completed flag, for this worker's surviving tasks
+    deleted = []
+    shared_flips = {}   # shared ID -> flips of it that were accepted
+    shared_deletes = set()
+    own_conflicts = 0
+    for step in range(operations):
+        roll = rng.random()
+        if roll < 0.25 and shared_ids:
+            task_id = rng.choice(shared_ids)
+            if task_id not in tasks:
+                continue  # gone as far as this worker knows
+            if rng.random() < 0.02:
+                todo_list.remove_task(tasks, task_id)
+                time.sleep(rng.random() * STALE_WINDOW)
+                if todo_list.log_task_change(tasks, {'op': 'delete', 'id': str(task_id)}):
+                    shared_deletes.add(task_id)
+            else:
+                task = todo_list.set_task_completion(tasks, task_id)
+                time.sleep(rng.random() * STALE_WINDOW)
+                if todo_list.log_task_change(tasks, {'op': 'put', 'task': task}):
+                    shared_flips[task_id] = shared_flips.get(task_id, 0) + 1
+            continue
+        if roll < 0.7 or not live:
+            task = todo_list.add_task(tasks, f"worker {worker_number} step {step}")
+            own_conflicts += not todo_list.log_task_change(tasks, {'op': 'put', 'task': task})
+            added.append(task.id)
+            live[task.id] = False
+        elif roll < 0.9:
+            task_id = rng.choice(list(live))
+            task = todo_list.set_task_completion(tasks, task_id)
+            own_conflicts += not todo_list.log_task_change(tasks, {'op': 'put', 'task': task})
+            live[task_id] = task.completed
+        else:
+            task_id = rng.choice(list(live))
+            todo_list.remove_task(tasks, task_id)
+            own_conflicts += not todo_list.log_task_change(tasks, {'op': 'delete', 'id': str(task_id)})
+            del live[task_id]
+            deleted.append(task_id)
+
+    results.put((worker_number, added, live, deleted, shared_flips, shared_deletes, own_conflicts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=300, help="operations per worker")
+    parser.add_argument("--compact-bytes", type=int, default=16 * 1024,
+                        help="journal size that triggers compaction (default: 16 KiB)")
+    parser.add_argument("--shared", type=int, default=20, help="tasks every worker flips and deletes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        os.chdir(data_dir)
+        tasks = todo_list.load_task_dictionary()
+        shared = [todo_list.add_task(tasks, f"shared task {n}") for n in range(args.shared)]
+        todo_list.log_task_changes(tasks, [{'op': 'put', 'task': task} for task in shared])
+        shared_ids = [task.id for task in shared]
+
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=worker,
+                                             args=(n, args.ops, data_dir, args.compact_bytes, shared_ids, results))
+                     for n in range(args.workers)]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        outcomes = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        tasks = todo_list.load_task_dictionary()
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    problems = []
+    all_added = shared_ids + [task_id for outcome in outcomes for task_id in outcome[1]]
+    if len(all_added) != len(set(all_added)):
+        problems.append(f"{len(all_added) - len(set(all_added))} task IDs were handed out twice")
+    accepted_flips = dict.fromkeys(shared_ids, 0)
+    accepted_deletes = set()
+    for outcome in outcomes:
+        for task_id, flips in outcome[4].items():
+            accepted_flips[task_id] += flips
+        accepted_deletes |= outcome[5]
+    for task_id, flips in accepted_flips.items():
+        task = tasks.get(task_id)
+        if task_id in accepted_deletes:
+            if task is not None:
+                problems.append(f"shared task {task_id} came back after an accepted delete")
+        elif task is None:
+            problems.append(f"shared task {task_id} was lost")
+        elif task.completed != (flips % 2 == 1) or task.version != flips:
+            problems.append(f"shared task {task_id}: {flips} flips accepted, but it is at version "
+                            f"{task.version}, completed={task.completed}")
+    for worker_number, _, live, deleted, _, _, own_conflicts in outcomes:
+        if own_conflicts:
+            problems.append(f"worker {worker_number}: {own_conflicts} edits to its own tasks reported as conflicts")
+        for task_id, completed in live.items():
+            task = tasks.get(task_id)
+            if task is None:
+                problems.append(f"worker {worker_number}: task {task_id} was lost")
+            elif task.completed != completed:
+                problems.append(f"worker {worker_number}: task {task_id} lost a status change")
+        for task_id in deleted:
+            if task_id in tasks:
+                problems.append(f"worker {worker_number}: deleted task {task_id} came back")
+
+    total_ops = args.workers * args.ops
+    print(f"{args.workers} workers x {args.ops} ops: {elapsed:.2f}s, {total_ops / elapsed:,.0f} ops/s")
+    print(f"{len(all_added)} tasks added, {len(tasks)} in the final store")
+    print(f"shared tasks: {sum(accepted_flips.values())} flips and {len(accepted_deletes)} deletes accepted")
+    if problems:
+        print(f"FAILED: {len(problems)} problem(s)")
+        for problem in problems[:20]:
+            print("  " + problem)
+        sys.exit(1)
+    print("OK: no lost writes, no duplicate IDs")
+
+
+if __name__ == "__main__":
+    main()
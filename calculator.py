@@ -1,91 +1,635 @@
+import argparse
+import decimal
+import functools
+import json
+import math
+import os
+import re
 import sys
+from fractions import Fraction
 
-# --- Unit Conversion Data ---
-# Structure: {Unit Type: {From Unit: {To Unit: Conversion Factor}}}
-# Example: Convert 1 meter (Length/Meters) to centimeters (Length/Centimeters)
-# Conversion Factor: 100.0 (1 meter * 100.0 = 100 centimeters)
-CONVERSION_FACTORS = {
-    "LENGTH": {
-        "METERS": 1.0, "FEET": 3.28084, "INCHES": 39.3701, "CENTIMETERS": 100.0,
-    },
-    "MASS": {
-        "KILOGRAMS": 1.0, "POUNDS": 2.20462, "OUNCES": 35.274, "GRAMS": 1000.0,
-    },
-    "TEMPERATURE": { # Simple offset-based conversion requires dedicated logic
-        "CELSIUS": 1.0, "FAHRENHEIT": 1.0, "KELVIN": 1.0
-    }
+from pool_map import chunked, ordered_pool_map
+
+try:
+    import numpy as np
+except ImportError:
+    # convert_many still works on plain sequences without NumPy
+    np = None
+
+# --- Unit Registry ---
+# Every unit is defined against its category's base unit as an affine map:
+#     value_in_unit = value_in_base * factor + offset
+# (plain factors for length and mass, a factor and an offset for temperature).
+# The definitions live in units.json next to this file, so new units need no code.
+
+UNIT_DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "units.json")
+
+
+class UnitRegistry:
+    """
+    Holds the unit definitions and, for every from->to pair within a category,
+    the precomputed direct transform (scale, offset) with
+        result = value * scale + offset
+    so resolving a conversion is a table lookup no matter how many units exist.
+    Names are case-insensitive, and each unit can have any number of aliases.
+    """
+
+    def __init__(self):
+        self.definitions = {}  # CATEGORY -> {UNIT: (factor, offset)}
+        self.names = {}        # CATEGORY -> {UNIT or ALIAS: UNIT}
+        self.transforms = {}   # CATEGORY -> {FROM: {TO: (scale, offset)}}
+
+    def register_unit(self, category, unit, factor, offset=0.0, aliases=()):
+        """Adds (or redefines) a unit and precomputes its transforms to and from every other unit."""
+        category, unit = category.strip().upper(), unit.strip().upper()
+        factor, offset = float(factor), float(offset)
+        if factor == 0:
+            raise ValueError(f"Unit {unit} must have a non-zero factor.")
+
+        definitions = self.definitions.setdefault(category, {})
+        names = self.names.setdefault(category, {})
+        transforms = self.transforms.setdefault(category, {})
+        definitions[unit] = (factor, offset)
+        names[unit] = unit
+        for alias in aliases:
+            names[alias.strip().upper()] = unit
+
+        transforms[unit] = {}
+        for other, (other_factor, other_offset) in definitions.items():
+            transforms[unit][other] = self._pair_transform(factor, offset, other_factor, other_offset)
+            transforms[other][unit] = self._pair_transform(other_factor, other_offset, factor, offset)
+
+    @staticmethod
+    def _pair_transform(from_factor, from_offset, to_factor, to_offset):
+        # base = (value - from_offset) / from_factor; result = base * to_factor + to_offset
+        scale = to_factor / from_factor
+        return scale, to_offset - from_offset * scale
+
+    def load_file(self, path):
+        """
+        Registers every unit in a JSON file shaped like units.json:
+        {"CATEGORY": {"UNIT": {"factor": 1.0, "offset": 0.0, "aliases": [...]}}}
+        Keys starting with '_' are ignored (use them for comments).
+        """
+        with open(path, 'r') as file:
+            data = json.load(file)
+        for category, units in data.items():
+            if category.startswith("_"):
+                continue
+            for unit, spec in units.items():
+                self.register_unit(category, unit, spec["factor"], spec.get("offset", 0.0),
+                                   spec.get("aliases", ()))
+
+    def categories(self):
+        return list(self.definitions)
+
+    def units(self, category):
+        """The canonical unit names of a category (aliases not included)."""
+        return list(self.definitions.get(category.strip().upper(), ()))
+
+    def _canonical(self, category, from_unit, to_unit):
+        category = category.strip().upper()
+        names = self.names.get(category)
+        if names is None:
+            raise ValueError(f"Unknown category '{category}'.")
+        from_name = names.get(from_unit.strip().upper())
+        to_name = names.get(to_unit.strip().upper())
+        if from_name is None or to_name is None:
+            raise ValueError("Invalid unit names for the selected category.")
+        return category, from_name, to_name
+
+    def resolve(self, category, from_unit, to_unit):
+        """
+        Returns the (scale, offset) transform for a conversion.
+        Raises ValueError for an unknown category or unit name.
+        """
+        category, from_name, to_name = self._canonical(category, from_unit, to_unit)
+        return self.transforms[category][from_name][to_name]
+
+    def resolve_exact(self, category, from_unit, to_unit, number):
+        """
+        Like resolve(), but computes the transform in `number` arithmetic
+        (Decimal or Fraction) from the factors as written in the data file,
+        instead of using the precomputed floats.
+        """
+        category, from_name, to_name = self._canonical(category, from_unit, to_unit)
+        from_factor, from_offset = (number(repr(x)) for x in self.definitions[category][from_name])
+        to_factor, to_offset = (number(repr(x)) for x in self.definitions[category][to_name])
+        scale = to_factor / from_factor
+        return scale, to_offset - from_offset * scale
+
+
+UNIT_REGISTRY = UnitRegistry()
+UNIT_REGISTRY.load_file(UNIT_DATA_FILE)
+
+# --- Expression Engine ---
+# Replaces eval(): expressions are tokenized and parsed here, and only the
+# constructs below can ever reach Python's compiler. Compiled expressions are
+# cached, so a formula that repeats is never parsed twice.
+
+SAFE_FUNCTIONS = {
+    "abs": abs, "round": round, "min": min, "max": max,
+    "sqrt": math.sqrt, "exp": math.exp, "log": math.log, "log10": math.log10, "log2": math.log2,
+    "sin": math.sin, "cos": math.cos, "tan": math.tan,
+    "asin": math.asin, "acos": math.acos, "atan": math.atan,
+    "floor": math.floor, "ceil": math.ceil, "hypot": math.hypot,
+    "radians": math.radians, "degrees": math.degrees,
 }
+SAFE_CONSTANTS = {"pi": math.pi, "e": math.e, "tau": math.tau}
+
+# Exact (int or Fraction) powers whose result would be larger than this many
+# bits are computed in floating point instead, so inputs like 9**9**9 or
+# (10**10000)**10000 raise OverflowError instead of hanging the process
+MAX_EXACT_POWER_BITS = 100_000
+EXPRESSION_CACHE_SIZE = 4096
+
+TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+        (?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)
+      | (?P<name>[A-Za-z_]\w*)
+      | (?P<op>\*\*|//|[-+*/%(),])
+    )""", re.VERBOSE)
+
+
+def _exact_bits(value):
+    if isinstance(value, Fraction):
+        return max(value.numerator.bit_length(), value.denominator.bit_length())
+    return value.bit_length()
+
+
+def _safe_pow(base, exponent):
+    # Exact powers are computed exactly, so bound the size of the result (about
+    # bits of base * exponent); a small exponent on a huge base hangs as well
+    if (isinstance(exponent, (int, Fraction)) and isinstance(base, (int, Fraction))
+            and _exact_bits(base) * abs(exponent) > MAX_EXACT_POWER_BITS):
+        return float(base) ** float(exponent)
+    return base ** exponent
+
+
+EVAL_NAMESPACE = {"__builtins__": {}, "_pow": _safe_pow, **SAFE_FUNCTIONS, **SAFE_CONSTANTS}
+
+# --- Numeric Modes ---
+# "float" is the default and the fast path. In "decimal" and "fraction" mode
+# every number literal becomes an exact Decimal or Fraction, and Decimal
+# arithmetic is rounded to the chosen precision. Functions without an exact counterpart are computed in
+# floating point and their result converted back.
+
+NUMERIC_MODES = ("float", "decimal", "fraction")
+DECIMAL_PRECISION = 28  # significant digits in decimal mode
+
+
+def _decimal_method(name):
+    def function(value):
+        return getattr(decimal.Decimal(value), name)()
+    return function
+
+
+def _via_float(number, function):
+    def wrapped(*args):
+        result = function(*map(float, args))
+        return number(repr(result)) if isinstance(result, float) else result
+    return wrapped
 
-def standard_calculator(expression):
+
+def _nonzero(divisor):
+    # Decimal signals x / 0, x // 0 and x % 0 with a zero x as a bare
+    # InvalidOperation (DivisionUndefined); make every division by zero a
+    # ZeroDivisionError, so it is reported as one
+    if not divisor:
+        raise ZeroDivisionError("division by zero")
+    return divisor
+
+
+def _exact_namespace(number, overrides=()):
+    functions = {name: _via_float(number, function) for name, function in SAFE_FUNCTIONS.items()}
+    for name in ("abs", "round", "min", "max"):
+        functions[name] = SAFE_FUNCTIONS[name]
+    functions.update(overrides)
+    constants = {name: number(repr(value)) for name, value in SAFE_CONSTANTS.items()}
+    return {"__builtins__": {}, "_pow": _safe_pow, "_nonzero": _nonzero, **functions, **constants}
+
+
+NUMERIC_TYPES = {"decimal": decimal.Decimal, "fraction": Fraction}
+NUMERIC_NAMESPACES = {
+    "float": EVAL_NAMESPACE,
+    "decimal": _exact_namespace(decimal.Decimal, {
+        "sqrt": _decimal_method("sqrt"), "exp": _decimal_method("exp"),
+        "log10": _decimal_method("log10"),
+    }),
+    "fraction": _exact_namespace(Fraction),
+}
+
+
+def parse_number(text, mode="float"):
+    """Converts user input to the mode's number type; raises ValueError if it is not a number."""
+    if mode == "float":
+        return float(text)
+    if mode == "decimal":
+        try:
+            return decimal.Decimal(text.strip())
+        except decimal.InvalidOperation:
+            raise ValueError(f"could not convert string to Decimal: {text!r}")
+    if mode == "fraction":
+        try:
+            return Fraction(text.strip())
+        except ZeroDivisionError:
+            raise ValueError(f"zero denominator in {text!r}")
+    raise ValueError(f"Unknown numeric mode '{mode}'.")
+
+
+def format_number(value, places=4):
+    """Decimals and Fractions are shown in full; floats keep the fixed-point format."""
+    if isinstance(value, (decimal.Decimal, Fraction)):
+        return str(value)
+    return f"{value:.{places}f}"
+
+
+def tokenize_expression(expression):
+    """Splits an expression into (kind, text) tokens; raises SyntaxError on anything else."""
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = TOKEN_PATTERN.match(expression, position)
+        if match is None:
+            raise SyntaxError(f"unexpected character {expression[position]!r} at position {position}")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        position = match.end()
+    return tokens
+
+
+class ExpressionParser:
     """
-    Performs standard arithmetic using Python's built-in evaluation function.
-    Handles common errors gracefully.
+    Recursive-descent parser with Python's precedence rules:
+        expr   := term (('+' | '-') term)*
+        term   := unary (('*' | '/' | '//' | '%') unary)*
+        unary  := ('+' | '-') unary | power
+        power  := atom ['**' unary]
+        atom   := number | constant | function '(' expr (',' expr)* ')' | '(' expr ')'
+    It returns the expression as Python source, with parentheses only where
+    precedence needs them: a long sum or a run of signs nests no deeper than
+    it would in eval(). With exact=True number literals are collected in
+    self.literals and emitted as _k[index], so they can be converted to
+    Decimal or Fraction once, and every divisor is wrapped in _nonzero().
+    """
+
+    # Binding strength of the emitted source; every parse method returns (source, strength)
+    SUM, PRODUCT, SIGNED, ATOM = range(4)
+
+    def __init__(self, tokens, exact=False):
+        self.tokens = tokens
+        self.position = 0
+        self.exact = exact
+        self.literals = []
+
+    @staticmethod
+    def _operand(parsed, minimum):
+        source, strength = parsed
+        return source if strength >= minimum else f"({source})"
+
+    def _peek(self):
+        return self.tokens[self.position][1] if self.position < len(self.tokens) else None
+
+    def _take(self, expected=None):
+        if self.position >= len(self.tokens):
+            raise SyntaxError("unexpected end of expression")
+        kind, text = self.tokens[self.position]
+        if expected is not None and text != expected:
+            raise SyntaxError(f"expected {expected!r} but found {text!r}")
+        self.position += 1
+        return kind, text
+
+    def parse(self):
+        source, _ = self._expr()
+        if self.position != len(self.tokens):
+            raise SyntaxError(f"unexpected {self._peek()!r}")
+        return source
+
+    def _expr(self):
+        parsed = self._term()
+        while self._peek() in ("+", "-"):
+            _, op = self._take()
+            right = self._operand(self._term(), self.PRODUCT)
+            parsed = (f"{parsed[0]}{op}{right}", self.SUM)
+        return parsed
+
+    def _term(self):
+        parsed = self._unary()
+        while self._peek() in ("*", "/", "//", "%"):
+            _, op = self._take()
+            left = self._operand(parsed, self.PRODUCT)
+            if self.exact and op != "*":
+                right = f"_nonzero({self._unary()[0]})"
+            else:
+                right = self._operand(self._unary(), self.SIGNED)
+            parsed = (f"{left}{op}{right}", self.PRODUCT)
+        return parsed
+
+    def _unary(self):
+        # A loop rather than recursion, so a long run of signs can't exhaust the stack
+        signs = []
+        while self._peek() in ("+", "-"):
+            signs.append(self._take()[1])
+        parsed = self._power()
+        if not signs:
+            return parsed
+        return "".join(signs) + self._operand(parsed, self.SIGNED), self.SIGNED
+
+    def _power(self):
+        base = self._atom()
+        if self._peek() == "**":
+            self._take()
+            return f"_pow({base[0]},{self._unary()[0]})", self.ATOM
+        return base
+
+    def _atom(self):
+        kind, text = self._take()
+        if kind == "number":
+            if not self.exact:
+                return text, self.ATOM
+            self.literals.append(text)
+            return f"_k[{len(self.literals) - 1}]", self.ATOM
+        if kind == "name":
+            if self._peek() == "(":
+                if text not in SAFE_FUNCTIONS:
+                    raise NameError(f"unknown function '{text}'")
+                self._take("(")
+                arguments = [self._expr()[0]]
+                while self._peek() == ",":
+                    self._take()
+                    arguments.append(self._expr()[0])
+                self._take(")")
+                return f"{text}({','.join(arguments)})", self.ATOM
+            if text not in SAFE_CONSTANTS:
+                raise NameError(f"name '{text}' is not defined")
+            return text, self.ATOM
+        if text == "(":
+            parsed = self._expr()
+            self._take(")")
+            return parsed
+        raise SyntaxError(f"unexpected {text!r}")
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(expression):
+    """
+    Parses an expression once and returns its compiled code object.
+    Raises SyntaxError or NameError for anything outside the supported grammar.
+    """
+    source = ExpressionParser(tokenize_expression(expression)).parse()
+    return compile(source, "<expression>", "eval")
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_exact_expression(expression, mode):
+    """
+    Like compile_expression(), for decimal or fraction mode. Returns the code
+    object and its number literals already converted to the mode's type.
+    """
+    parser = ExpressionParser(tokenize_expression(expression), exact=True)
+    code = compile(parser.parse(), "<expression>", "eval")
+    number = NUMERIC_TYPES[mode]
+    return code, tuple(number(text) for text in parser.literals)
+
+
+def evaluate_expression(expression, mode="float", precision=DECIMAL_PRECISION):
+    """
+    Evaluates an arithmetic expression safely; raises the same errors eval() would.
+    `mode` is one of NUMERIC_MODES; `precision` only applies to decimal mode.
+    """
+    if mode == "float":
+        return eval(compile_expression(expression), EVAL_NAMESPACE)
+    if mode not in NUMERIC_TYPES:
+        raise ValueError(f"Unknown numeric mode '{mode}'.")
+    code, literals = compile_exact_expression(expression, mode)
+    if mode == "decimal":
+        with decimal.localcontext() as context:
+            context.prec = precision
+            return eval(code, NUMERIC_NAMESPACES["decimal"], {"_k": literals})
+    return eval(code, NUMERIC_NAMESPACES[mode], {"_k": literals})
+
+
+def calculate(expression, mode="float", precision=DECIMAL_PRECISION):
+    """
+    Evaluates an expression with standard_calculator's error handling, but
+    reports instead of printing.
+
+    Returns:
+        tuple: (result, None) on success, or (None, error message) on failure
     """
-    print("\n--- Standard Calculation ---")
     try:
-        # Use simple string evaluation (be cautious of external input in real apps)
-        # For this internship demonstration, it showcases simple math execution.
-        result = eval(expression)
-        print(f"Result: {expression} = {result:.4f}")
+        return evaluate_expression(expression, mode, precision), None
     except (NameError, TypeError, SyntaxError):
-        print("Error: Invalid mathematical expression.")
+        return None, "Invalid mathematical expression."
     except ZeroDivisionError:
-        print("Error: Cannot divide by zero.")
+        return None, "Cannot divide by zero."
     except Exception as e:
-        print(f"Error: An unexpected error occurred: {e}")
+        return None, f"An unexpected error occurred: {e}"
 
-def convert_units(category, value, from_unit, to_unit):
+
+def calculation_message(expression, mode="float", precision=DECIMAL_PRECISION):
     """
-    Performs unit conversion based on predefined factors.
+    Evaluates an expression and returns the line standard_calculator prints:
+    the formatted result, or an error message.
     """
-    value = float(value)
-    category = category.upper()
+    result, error = calculate(expression, mode, precision)
+    if error is not None:
+        return f"Error: {error}"
+    try:
+        return f"Result: {expression} = {format_number(result)}"
+    except Exception as e:  # e.g. OverflowError: an int too large to format as a float
+        return f"Error: An unexpected error occurred: {e}"
+
+
+def standard_calculator(expression, mode="float", precision=DECIMAL_PRECISION):
+    """
+    Performs standard arithmetic using the safe expression engine above.
+    Handles common errors gracefully.
+    """
+    print("\n--- Standard Calculation ---")
+    print(calculation_message(expression, mode, precision))
+
+def resolve_conversion(category, from_unit, to_unit):
+    """
+    Works out a conversion as an affine transform (see UnitRegistry.resolve).
+    
+    Returns:
+        tuple: (scale, offset) such that result = value * scale + offset
+    Raises:
+        ValueError: for an unknown category or unit name
+    """
+    return UNIT_REGISTRY.resolve(category, from_unit, to_unit)
+
+
+def convert_many(values, category, from_unit, to_unit):
+    """
+    Converts a whole sequence of readings at once. The conversion is resolved
+    a single time and applied as one vectorized multiply-add.
+    
+    Returns:
+        numpy.ndarray of float64 (a list of floats when NumPy is not installed)
+    Raises:
+        ValueError: for an unknown category or unit name
+    """
+    scale, offset = resolve_conversion(category, from_unit, to_unit)
+    if np is None:
+        return [value * scale + offset for value in map(float, values)]
+    result = np.asarray(values, dtype=np.float64) * scale
+    if offset:
+        result += offset
+    return result
+
+
+def conversion_message(category, value, from_unit, to_unit, mode="float", precision=DECIMAL_PRECISION):
+    """
+    Converts a value and returns the line convert_units prints:
+    the formatted result, or an error message.
+    Raises ValueError if `value` is not a number.
+    """
+    value = parse_number(value, mode)
     from_unit = from_unit.upper()
     to_unit = to_unit.upper()
 
-    if category not in CONVERSION_FACTORS:
-        print(f"Error: Unknown category '{category}'.")
-        return
+    try:
+        if mode == "float":
+            scale, offset = resolve_conversion(category, from_unit, to_unit)
+            result = value * scale + offset
+        elif mode == "decimal":
+            with decimal.localcontext() as context:
+                context.prec = precision
+                scale, offset = UNIT_REGISTRY.resolve_exact(category, from_unit, to_unit, decimal.Decimal)
+                result = value * scale + offset
+        else:
+            scale, offset = UNIT_REGISTRY.resolve_exact(category, from_unit, to_unit, Fraction)
+            result = value * scale + offset
+    except ValueError as e:
+        return f"Error: {e}"
+
+    return f"Converted Result: {format_number(value, 2)} {from_unit} = {format_number(result)} {to_unit}"
+
 
-    if category == "TEMPERATURE":
-        # Temperature requires specific formulas, not just factors
-        result = handle_temperature_conversion(value, from_unit, to_unit)
+def convert_units(category, value, from_unit, to_unit, mode="float", precision=DECIMAL_PRECISION):
+    """
+    Performs unit conversion with the transforms precomputed by UNIT_REGISTRY.
+    In decimal or fraction mode the transform is worked out in that arithmetic.
+    """
+    message = conversion_message(category, value, from_unit, to_unit, mode, precision)
+    if message.startswith("Error:"):
+        print(message)
     else:
-        # Generic factor-based conversion
-        factors = CONVERSION_FACTORS[category]
+        print("\n" + message)
 
-        if from_unit not in factors or to_unit not in factors:
-            print("Error: Invalid unit names for the selected category.")
-            return
+def handle_temperature_conversion(value, from_unit, to_unit):
+    """
+    Converts between temperature scales with the registry's affine transforms.
+    `value` may be a number or a NumPy array.
+    """
+    for unit in (from_unit, to_unit):
+        if unit.strip().upper() not in UNIT_REGISTRY.names["TEMPERATURE"]:
+            return f"Error: Unknown temperature unit {unit}"
+    scale, offset = resolve_conversion("TEMPERATURE", from_unit, to_unit)
+    return value * scale + offset
 
-        # Convert to base unit first, then to target unit
-        base_value = value / factors[from_unit]
-        result = base_value * factors[to_unit]
 
-    print(f"\nConverted Result: {value:.2f} {from_unit} = {result:.4f} {to_unit}")
+# --- Parallel Batch Evaluation ---
+# Large batches are cut into chunks and the chunks are spread over a process
+# pool (see pool_map.py), and results come back in input order.
+
+BATCH_CHUNK_SIZE = 2000  # expressions per task sent to a worker
+
+
+def _evaluate_chunk(expressions, mode="float", precision=DECIMAL_PRECISION):
+    return [calculate(expression, mode, precision) for expression in expressions]
+
+
+def evaluate_batch(expressions, workers=None, chunk_size=BATCH_CHUNK_SIZE,
+                   mode="float", precision=DECIMAL_PRECISION):
+    """
+    Evaluates a list or stream of expressions across a process pool.
+    Errors are reported per item exactly as calculate() reports them.
+
+    Args:
+        expressions: any iterable of expression strings
+        workers: number of processes (default: all CPU cores)
+        chunk_size: expressions handed to a worker at a time
+        mode, precision: numeric mode, as for evaluate_expression()
+
+    Yields:
+        tuple: (result, error) for each expression, in input order
+    """
+    workers = workers or os.cpu_count() or 1
+    function = functools.partial(_evaluate_chunk, mode=mode, precision=precision)
+    for results in ordered_pool_map(function, chunked(expressions, chunk_size), workers):
+        yield from results
+
+
+# --- Streaming Mode ---
+# For pipelines: read one expression (or conversion) per line from a file or
+# stdin and write one result line per input line, in constant memory.
+
+STREAM_CHUNK_LINES = 4096  # result lines collected before each write
+
+
+def stream_message(line, convert, mode="float", precision=DECIMAL_PRECISION):
+    """
+    Produces the result line for one input line. In conversion mode a line is
+    'CATEGORY VALUE FROM_UNIT TO_UNIT' (e.g. LENGTH 10 METERS FEET).
+    Blank lines are passed through so output stays aligned with input.
+    """
+    line = line.strip()
+    if not line:
+        return ""
+    if not convert:
+        return calculation_message(line, mode, precision)
+    fields = line.split()
+    if len(fields) != 4:
+        return "Error: Expected 'CATEGORY VALUE FROM_UNIT TO_UNIT'."
+    category, value, from_unit, to_unit = fields
+    try:
+        return conversion_message(category, value, from_unit, to_unit, mode, precision)
+    except ValueError:
+        return "Error: Invalid input for value. Please enter a number."
+
+
+def _stream_chunk(lines, convert=False, mode="float", precision=DECIMAL_PRECISION):
+    messages = [stream_message(line, convert, mode, precision) for line in lines]
+    messages.append("")
+    return len(lines), "\n".join(messages)
+
+
+def stream_lines(input_file, output_file, convert=False, chunk_lines=STREAM_CHUNK_LINES, workers=1,
+                 mode="float", precision=DECIMAL_PRECISION):
+    """
+    Evaluates every line of `input_file` and writes the results to `output_file`.
+    Only a bounded number of chunks is held at a time, and each chunk of
+    results is written with a single write call. With workers > 1 the chunks
+    are evaluated in a process pool (see evaluate_batch).
+
+    Returns:
+        int: the number of lines processed
+    """
+    function = functools.partial(_stream_chunk, convert=convert, mode=mode, precision=precision)
+    count = 0
+    for lines, text in ordered_pool_map(function, chunked(input_file, chunk_lines), workers):
+        output_file.write(text)
+        count += lines
+    output_file.flush()
+    return count
 
-def handle_temperature_conversion(value, from_unit, to_unit):
-    """Handles the complex logic for temperature conversions."""
-    
-    # 1. Convert initial unit to Celsius (base for temperature)
-    if from_unit == "FAHRENHEIT":
-        celsius = (value - 32) * 5/9
-    elif from_unit == "KELVIN":
-        celsius = value - 273.15
-    elif from_unit == "CELSIUS":
-        celsius = value
-    else:
-        return f"Error: Unknown temperature unit {from_unit}"
-
-    # 2. Convert Celsius to the target unit
-    if to_unit == "FAHRENHEIT":
-        return celsius * 9/5 + 32
-    elif to_unit == "KELVIN":
-        return celsius + 273.15
-    elif to_unit == "CELSIUS":
-        return celsius
-    else:
-        return f"Error: Unknown temperature unit {to_unit}"
+
+def run_stream(input_path="-", output_path="-", convert=False, workers=1,
+               mode="float", precision=DECIMAL_PRECISION):
+    """Opens the input/output ('-' means stdin/stdout) and streams between them."""
+    input_file = sys.stdin if input_path == "-" else open(input_path, 'r')
+    output_file = sys.stdout if output_path == "-" else open(output_path, 'w', buffering=1 << 20)
+    try:
+        return stream_lines(input_file, output_file, convert, workers=workers, mode=mode, precision=precision)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
 
 
 def display_menu():
@@ -99,7 +643,7 @@ def display_menu():
     print("-" * 50)
 
 
-def main_app_loop():
+def main_app_loop(mode="float", precision=DECIMAL_PRECISION):
     """The main loop managing user interaction and mode switching."""
     while True:
         display_menu()
@@ -113,31 +657,31 @@ def main_app_loop():
             print("\nMODE: Standard Calculator")
             expr = input("Enter expression (e.g., 10 + 5 * 2): ").strip()
             if expr:
-                standard_calculator(expr)
+                standard_calculator(expr, mode, precision)
         
         elif choice == '2':
             print("\nMODE: Unit Converter")
             
             # List available categories
-            categories = ", ".join(CONVERSION_FACTORS.keys())
+            categories = ", ".join(UNIT_REGISTRY.categories())
             print(f"Available Categories: {categories}")
             category = input("Enter category (e.g., LENGTH): ").strip()
 
-            if category.upper() not in CONVERSION_FACTORS:
+            if category.upper() not in UNIT_REGISTRY.categories():
                 print("Invalid category. Returning to main menu.")
                 continue
 
             # List available units for the chosen category
-            units = ", ".join(CONVERSION_FACTORS[category.upper()].keys())
+            units = ", ".join(UNIT_REGISTRY.units(category))
             print(f"Units for {category.upper()}: {units}")
             
             try:
                 value = input("Enter value to convert: ").strip()
-                float(value) # Validate input is a number early
+                parse_number(value, mode) # Validate input is a number early
                 from_unit = input("Convert FROM unit (e.g., METERS): ").strip()
                 to_unit = input("Convert TO unit (e.g., FEET): ").strip()
                 
-                convert_units(category, value, from_unit, to_unit)
+                convert_units(category, value, from_unit, to_unit, mode, precision)
                 
             except ValueError:
                 print("Invalid input for value. Please enter a number.")
@@ -147,5 +691,47 @@ def main_app_loop():
         else:
             print("Invalid choice. Please enter 1, 2, or QUIT.")
 
+def build_argument_parser():
+    """Describes the command line; with no arguments the interactive menu runs."""
+    parser = argparse.ArgumentParser(
+        description="Dual-mode calculator and unit converter. "
+                    "Run without arguments for the interactive menu.")
+    parser.add_argument("--mode", choices=NUMERIC_MODES, default="float",
+                        help="number type for calculations and conversions (default: float)")
+    parser.add_argument("--precision", type=int, default=DECIMAL_PRECISION,
+                        help=f"significant digits in decimal mode (default: {DECIMAL_PRECISION})")
+    parser.add_argument("--stream", action="store_true",
+                        help="evaluate one expression per line from INPUT instead of prompting")
+    parser.add_argument("--convert", action="store_true",
+                        help="with --stream, treat lines as 'CATEGORY VALUE FROM_UNIT TO_UNIT'")
+    parser.add_argument("-i", "--input", default="-", help="input file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="with --stream, evaluate chunks in this many processes (0: all cores)")
+    return parser
+
+
+def main(argv=None):
+    """Entry point: streaming mode when requested, the interactive menu otherwise."""
+    parser = build_argument_parser()
+    args = parser.parse_args(argv)
+    if args.precision < 1:
+        parser.error("--precision must be at least 1")
+    if not args.stream:
+        main_app_loop(args.mode, args.precision)
+        return 0
+    try:
+        run_stream(args.input, args.output, args.convert, args.workers or os.cpu_count() or 1,
+                   args.mode, args.precision)
+    except OSError as e:
+        if isinstance(e, BrokenPipeError):
+            # The reader went away (e.g. piped into head); stop quietly.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 0
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
 if __name__ == "__main__":
-    main_app_loop()
+    sys.exit(main())
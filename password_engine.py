@@ -0,0 +1,203 @@
+"""
+Headless password generation engine used by passwordgen.py.
+
+Randomness comes from os.urandom (the operating system's CSPRNG) in bulk
+blocks. Each random byte is mapped to a character with rejection sampling:
+bytes above the largest multiple of the pool size are dropped, so every
+character is equally likely (no modulo bias). The byte -> character mapping
+and the drop are a single bytes.translate() call per block.
+
+A password must contain at least one character of every selected type.
+Candidates that miss a type are rejected and redrawn, so every valid
+password is equally likely. The check runs over a whole block of candidates
+at once with one regular expression.
+
+Run it directly for a command-line generator that needs no GUI packages:
+    python password_engine.py --count 1000 --length 16 -o passwords.txt
+"""
+import argparse
+import os
+import re
+import string
+import sys
+
+SAFE_SYMBOLS = "!@#$%^&*-=_+"
+AMBIGUOUS_CHARS = 'l1IO0'
+DEFAULT_LENGTH = 14
+BATCH_PASSWORDS = 8192  # candidates drawn per block
+EXHAUSTED_BATCHES = 3  # batches in a row without a single new password before unique mode gives up
+
+
+class PasswordConfigError(ValueError):
+    """A configuration no password can satisfy; `title` names the kind of problem."""
+
+    def __init__(self, title, message):
+        super().__init__(message)
+        self.title = title
+
+
+class PasswordEngine:
+    """
+    Generates passwords for one configuration. The character pool, the
+    sampling table and the validity check are built once in __init__, so
+    reuse the engine for as long as the configuration doesn't change.
+    """
+
+    def __init__(self, length=DEFAULT_LENGTH, upper=True, lower=True, digits=True, symbols=True,
+                 exclude_ambiguous=True):
+        selected = [(upper, string.ascii_uppercase), (lower, string.ascii_lowercase),
+                    (digits, string.digits), (symbols, SAFE_SYMBOLS)]
+        classes = [chars for enabled, chars in selected if enabled]
+        if exclude_ambiguous:
+            classes = ["".join(c for c in chars if c not in AMBIGUOUS_CHARS) for chars in classes]
+
+        if not classes:
+            raise PasswordConfigError("Configuration Error", "Please select at least one character type.")
+        if length < len(classes):
+            raise PasswordConfigError(
+                "Length Error",
+                f"Password length must be at least {len(classes)} to include all selected types.")
+
+        self.length = length
+        self.classes = classes
+        self.pool = "".join(classes)
+
+        # Byte b < limit maps to pool[b % len(pool)]; bytes >= limit are rejected
+        pool_bytes = self.pool.encode("ascii")
+        limit = 256 - 256 % len(pool_bytes)
+        self._table = bytes(pool_bytes[b % len(pool_bytes)] if b < limit else 0 for b in range(256))
+        self._rejected = bytes(range(limit, 256))
+        self._accept_rate = limit / 256
+
+        # One line per candidate; a line matches only if it has every selected type
+        lookaheads = "".join(f"(?=[^\\n]*[{re.escape(chars)}])" for chars in classes)
+        self._valid = re.compile(f"^{lookaheads}[^\\n]+$".encode("ascii"), re.MULTILINE)
+
+    def random_chars(self, count):
+        """Returns `count` characters drawn uniformly from the pool, as ASCII bytes."""
+        chunks = []
+        remaining = count
+        while remaining > 0:
+            # Ask for a little more than needed so one urandom call usually suffices
+            block = os.urandom(int(remaining / self._accept_rate * 1.05) + 64)
+            accepted = block.translate(self._table, self._rejected)
+            chunks.append(accepted[:remaining])
+            remaining -= len(chunks[-1])
+        return b"".join(chunks)
+
+    def generate(self, count=1):
+        """Returns a list of `count` new passwords."""
+        length = self.length
+        passwords = []
+        while len(passwords) < count:
+            candidates = min(BATCH_PASSWORDS, int((count - len(passwords)) * 1.1) + 8)
+            chars = self.random_chars(candidates * length)
+            lines = b"\n".join([chars[i:i + length] for i in range(0, len(chars), length)])
+            passwords.extend(self._valid.findall(lines))
+        del passwords[count:]
+        return [password.decode("ascii") for password in passwords]
+
+    def generate_password(self):
+        """Returns a single new password."""
+        return self.generate(1)[0]
+
+
+# --- Command Line ---
+
+def write_passwords(engine, count, output, history=None, unique=False):
+    """
+    Writes `count` passwords to `output`, one per line, one write per batch.
+    With a PasswordHistory, each password is recorded in it too, and with
+    unique=True any password it has already issued is dropped and replaced.
+    Returns the count, or raises PasswordConfigError if unique mode runs out
+    of new passwords.
+    """
+    if history is not None:
+        from password_strength import estimate_strength
+    remaining = count
+    stale_batches = 0
+    while remaining > 0:
+        if unique:
+            # Draw a full-size batch even near the end, so running out is told
+            # apart from a few unlucky draws
+            fresh = []
+            for password in engine.generate(min(BATCH_PASSWORDS, max(remaining, 256))):
+                # is_new sees every password recorded so far, including this batch's
+                if history.is_new(password):
+                    history.record(password, estimate_strength(password)[1])
+                    fresh.append(password)
+                    if len(fresh) == remaining:
+                        break
+            batch = fresh
+            stale_batches = 0 if fresh else stale_batches + 1
+            if stale_batches >= EXHAUSTED_BATCHES:
+                raise PasswordConfigError(
+                    "Uniqueness Error",
+                    "No new passwords left for these settings; allow a longer length or more character types.")
+        else:
+            batch = engine.generate(min(BATCH_PASSWORDS, remaining))
+            if history is not None:
+                for password in batch:
+                    history.record(password, estimate_strength(password)[1])
+        batch.append("")
+        output.write("\n".join(batch))
+        remaining -= len(batch) - 1
+    output.flush()
+    return count
+
+
+def build_argument_parser():
+    parser = argparse.ArgumentParser(description="Generate secure passwords without the GUI.")
+    parser.add_argument("-n", "--count", type=int, default=1, help="number of passwords (default: 1)")
+    parser.add_argument("-l", "--length", type=int, default=DEFAULT_LENGTH,
+                        help=f"password length (default: {DEFAULT_LENGTH})")
+    parser.add_argument("--no-upper", dest="upper", action="store_false", help="leave out A-Z")
+    parser.add_argument("--no-lower", dest="lower", action="store_false", help="leave out a-z")
+    parser.add_argument("--no-digits", dest="digits", action="store_false", help="leave out 0-9")
+    parser.add_argument("--no-symbols", dest="symbols", action="store_false", help=f"leave out {SAFE_SYMBOLS}")
+    parser.add_argument("--allow-ambiguous", dest="exclude_ambiguous", action="store_false",
+                        help=f"keep look-alike characters ({AMBIGUOUS_CHARS})")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--history", nargs="?", const="password_history.txt",
+                        help="also record each password's fingerprint in this history log "
+                             "(default: password_history.txt)")
+    parser.add_argument("--unique", action="store_true",
+                        help="never output a password the history has already issued (implies --history)")
+    return parser
+
+
+def main(argv=None):
+    """Entry point for the command-line generator; returns an exit code."""
+    args = build_argument_parser().parse_args(argv)
+    try:
+        engine = PasswordEngine(args.length, args.upper, args.lower, args.digits, args.symbols,
+                                args.exclude_ambiguous)
+    except PasswordConfigError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    history = None
+    if args.unique and not args.history:
+        args.history = "password_history.txt"
+    if args.history:
+        from password_history import PasswordHistory
+        history = PasswordHistory(args.history)
+    try:
+        if args.output == "-":
+            write_passwords(engine, args.count, sys.stdout, history, args.unique)
+        else:
+            with open(args.output, 'w', buffering=1 << 20) as output:
+                write_passwords(engine, args.count, output, history, args.unique)
+    except PasswordConfigError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); stop quietly.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,416 @@
+"""
+History log for generated passwords.
+
+Entries are buffered in memory and appended in batches (and at exit), so bulk
+generation costs one write per HISTORY_BUFFER_ENTRIES passwords instead of an
+open/write/close per password. The log rotates to password_history.txt.1,
+.2, ... once it grows past HISTORY_MAX_BYTES or gets older than
+HISTORY_MAX_AGE_DAYS.
+
+By default the log stores a fingerprint (HMAC-SHA256 under a random key kept
+in password_history.key) instead of the password. Every fingerprint also
+goes into an SQLite index (password_history.index), so "was this password
+ever issued?" is a single keyed lookup, however long the history is and
+across rotated files. Entries logged in plaintext (by older versions, or with
+plaintext=True) are indexed the first time the index is opened for writing.
+
+Fingerprints are also added to a persistent, memory-mapped Bloom filter
+(password_history.bloom) that sits in front of the index. For generators
+that must never reissue a password, is_new() answers most checks from the
+filter alone, in constant time. Only a filter hit (a real duplicate, or a
+false positive at about BLOOM_FALSE_POSITIVE_RATE while the filter holds fewer
+than its capacity) is confirmed against the index. The filter assumes one
+writing process at a time.
+"""
+import atexit
+import hashlib
+import hmac
+import math
+import mmap
+import os
+import sqlite3
+import struct
+import sys
+from datetime import datetime, timedelta
+
+HISTORY_FILE = "password_history.txt"
+HISTORY_BUFFER_ENTRIES = 4096  # random-key index inserts are much cheaper in big batches
+HISTORY_MAX_BYTES = 1024 * 1024
+HISTORY_MAX_AGE_DAYS = 30
+HISTORY_BACKUPS = 5
+FINGERPRINT_BYTES = 16  # truncated HMAC-SHA256; 128 bits is plenty to tell passwords apart
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+PLAINTEXT_MARKER = " | Password: "
+KEY_BYTES = 32
+INDEX_VERSION = 1  # PRAGMA user_version once the plaintext entries are indexed
+BLOOM_CAPACITY = 1_000_000  # passwords the filter is sized for (fixed when the file is created)
+BLOOM_FALSE_POSITIVE_RATE = 0.001
+
+
+class BloomFilter:
+    """
+    Bloom filter kept in a memory-mapped file, so it persists between runs and
+    costs no load time. Items are fingerprints (at least 16 random-looking
+    bytes). The k bit positions come from them by double hashing.
+
+    File layout: MAGIC, then bits (m), hashes (k) and items added, then m/8 bytes.
+    """
+
+    MAGIC = b"PWBLOOM1"
+    HEADER = struct.Struct("<8sQIQ")
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'r+b')
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, self.bits, self.hashes, self.count = self.HEADER.unpack_from(self._map)
+        if magic != self.MAGIC:
+            raise ValueError(f"{path} is not a password Bloom filter")
+
+    @classmethod
+    def create(cls, path, capacity=BLOOM_CAPACITY, false_positive_rate=BLOOM_FALSE_POSITIVE_RATE,
+               fingerprints=()):
+        """
+        Creates a filter sized for `capacity` items at `false_positive_rate`,
+        filled with `fingerprints`. It is built under a temporary name and moved
+        into place, so a crash never leaves a half-filled filter behind.
+        """
+        bits = max(64, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        bits = (bits + 7) // 8 * 8
+        hashes = max(1, round(bits / capacity * math.log(2)))
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'wb') as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, bits, hashes, 0))
+            file.truncate(cls.HEADER.size + bits // 8)
+        bloom = cls(temporary)
+        for fingerprint in fingerprints:
+            bloom.add(fingerprint)
+        bloom.close()  # also stores the count
+        os.replace(temporary, path)
+        return cls(path)
+
+    def _positions(self, fingerprint):
+        first = int.from_bytes(fingerprint[:8], "little")
+        step = int.from_bytes(fingerprint[8:16], "little") | 1
+        bits = self.bits
+        return [(first + i * step) % bits for i in range(self.hashes)]
+
+    def add(self, fingerprint):
+        mapped = self._map
+        offset = self.HEADER.size
+        for position in self._positions(fingerprint):
+            mapped[offset + (position >> 3)] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, fingerprint):
+        mapped = self._map
+        offset = self.HEADER.size
+        for position in self._positions(fingerprint):
+            if not mapped[offset + (position >> 3)] & 1 << (position & 7):
+                return False
+        return True
+
+    def false_positive_rate(self):
+        """Expected false-positive rate at the current fill: (1 - e^(-kn/m))^k."""
+        return (1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
+
+    def flush(self):
+        """Stores the item count in the header and writes dirty pages back."""
+        self.HEADER.pack_into(self._map, 0, self.MAGIC, self.bits, self.hashes, self.count)
+        self._map.flush()
+
+    def close(self):
+        self.flush()
+        self._map.close()
+        self._file.close()
+
+
+class PasswordHistory:
+    """
+    Buffered, rotating history log with a fingerprint index and Bloom filter.
+    Set plaintext=True to log the passwords themselves (the old format).
+    `bloom_capacity` only matters when the filter file is first created.
+    """
+
+    def __init__(self, path=HISTORY_FILE, plaintext=False, buffer_entries=HISTORY_BUFFER_ENTRIES,
+                 max_bytes=HISTORY_MAX_BYTES, max_age_days=HISTORY_MAX_AGE_DAYS, backups=HISTORY_BACKUPS,
+                 bloom_capacity=BLOOM_CAPACITY):
+        self.path = path
+        self.plaintext = plaintext
+        self.buffer_entries = buffer_entries
+        self.max_bytes = max_bytes
+        self.max_age = timedelta(days=max_age_days) if max_age_days else None
+        self.backups = backups
+        self.key_path = os.path.splitext(path)[0] + ".key"
+        self.index_path = os.path.splitext(path)[0] + ".index"
+        self.bloom_path = os.path.splitext(path)[0] + ".bloom"
+        self.bloom_capacity = bloom_capacity
+        self.bloom_hits = 0  # filter hits that needed the exact check (duplicates + false positives)
+        self._bloom = None
+        self._key = None
+        self._hmac = None
+        self._last_fingerprint = (None, None)
+        self._index = None
+        self._reader = None  # read-only index connection for was_issued()
+        self._lines = []
+        self._pending = {}  # fingerprint -> timestamp, not yet in the index
+        atexit.register(self.close)
+
+    # --- Fingerprints ---
+
+    def _load_key(self, create=True):
+        """The history key; None if it doesn't exist yet and `create` is False."""
+        if self._key is None:
+            try:
+                with open(self.key_path, 'rb') as file:
+                    key = file.read()
+            except FileNotFoundError:
+                if not create:
+                    return None
+                key = self._create_key()
+            if not key:
+                raise ValueError(f"{self.key_path} is empty; the history fingerprints cannot be checked")
+            self._key = key
+        return self._key
+
+    def _create_key(self):
+        """
+        Writes a new random key under a temporary name and links it into place,
+        so no process ever reads a half-written key. If another process got
+        there first, its key is used instead.
+        """
+        key = os.urandom(KEY_BYTES)
+        temporary = f"{self.key_path}.{os.getpid()}.tmp"
+        descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(key)
+                file.flush()
+                os.fsync(file.fileno())
+            try:
+                os.link(temporary, self.key_path)  # unlike a rename, never replaces an existing key
+            except FileExistsError:
+                with open(self.key_path, 'rb') as file:
+                    key = file.read()
+        finally:
+            os.remove(temporary)
+        return key
+
+    def fingerprint(self, password):
+        """The keyed fingerprint stored instead of the password, as bytes."""
+        if self._last_fingerprint[0] == password:
+            return self._last_fingerprint[1]  # is_new() followed by record() hashes once
+        if self._hmac is None:
+            self._hmac = hmac.new(self._load_key(), digestmod=hashlib.sha256)
+        digest = self._hmac.copy()  # reuses the keyed state instead of re-deriving it
+        digest.update(password.encode("utf-8"))
+        fingerprint = digest.digest()[:FINGERPRINT_BYTES]
+        self._last_fingerprint = (password, fingerprint)
+        return fingerprint
+
+    # --- Logging ---
+
+    def record(self, password, strength):
+        """Adds an entry to the buffer; the buffer is written once it is full."""
+        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+        fingerprint = self.fingerprint(password)
+        if self.plaintext:
+            self._lines.append(f"[{timestamp}] Strength: {strength} | Password: {password}\n")
+        else:
+            self._lines.append(f"[{timestamp}] Strength: {strength} | Fingerprint: {fingerprint.hex()}\n")
+        self._pending[fingerprint] = timestamp
+        self._open_bloom().add(fingerprint)
+        if len(self._lines) >= self.buffer_entries:
+            self.flush()
+
+    def flush(self):
+        """Writes buffered entries to the log and the index."""
+        if not self._lines:
+            return
+        try:
+            self._rotate_if_needed()
+            with open(self.path, "a") as file:
+                file.write("".join(self._lines))
+            index = self._open_index()
+            with index:
+                index.executemany("INSERT OR IGNORE INTO issued VALUES (?, ?)", self._pending.items())
+            if self._bloom is not None:
+                self._bloom.flush()
+        except (OSError, sqlite3.Error):
+            print(f"Warning: Could not write to history file: {self.path}", file=sys.stderr)
+            return
+        self._lines.clear()
+        self._pending.clear()
+
+    # --- Rotation ---
+
+    def _started_at(self):
+        """Timestamp of the log's first entry, or None if it has none."""
+        try:
+            with open(self.path, 'r') as file:
+                first = file.readline()
+            return datetime.strptime(first[1:first.index("]")], TIMESTAMP_FORMAT)
+        except (OSError, ValueError):
+            return None
+
+    def _rotate_if_needed(self):
+        try:
+            size = os.path.getsize(self.path)
+        except FileNotFoundError:
+            return
+        too_big = self.max_bytes and size >= self.max_bytes
+        started = self._started_at() if self.max_age and not too_big else None
+        too_old = started is not None and datetime.now() - started >= self.max_age
+        if not (too_big or too_old):
+            return
+        for number in range(self.backups - 1, 0, -1):
+            older = f"{self.path}.{number}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{number + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    # --- Lookup ---
+
+    def _log_files(self):
+        """The current log and its rotated copies that exist, newest first."""
+        paths = [self.path] + [f"{self.path}.{number}" for number in range(1, self.backups + 1)]
+        return [path for path in paths if os.path.exists(path)]
+
+    def _plaintext_entries(self):
+        """Yields (password, timestamp) for every plaintext entry in the log files."""
+        for path in self._log_files():
+            try:
+                with open(path, 'r', encoding="utf-8", errors="replace") as file:
+                    for line in file:
+                        head, marker, password = line.rstrip("\r\n").partition(PLAINTEXT_MARKER)
+                        if marker and password:
+                            yield password, head[1:head.find("]")]
+            except OSError:
+                continue
+
+    def _open_index(self):
+        """
+        The writable index connection, opened on first use and kept until
+        close(). An index that doesn't cover the plaintext entries yet is
+        filled with them.
+        """
+        if self._index is None:
+            index = sqlite3.connect(self.index_path)
+            # WAL with normal sync: a batch insert costs no fsync of the whole database
+            index.execute("PRAGMA journal_mode=WAL")
+            index.execute("PRAGMA synchronous=NORMAL")
+            index.execute("CREATE TABLE IF NOT EXISTS issued "
+                          "(fingerprint BLOB PRIMARY KEY, issued_at TEXT NOT NULL) WITHOUT ROWID")
+            self._index = index
+            if index.execute("PRAGMA user_version").fetchone()[0] < INDEX_VERSION:
+                self._index_plaintext_entries()
+        return self._index
+
+    def _index_plaintext_entries(self):
+        """Adds the plaintext log entries to the index."""
+        entries = {self.fingerprint(password): timestamp for password, timestamp in self._plaintext_entries()}
+        with self._index:
+            self._index.executemany("INSERT OR IGNORE INTO issued VALUES (?, ?)", entries.items())
+            self._index.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        if entries and self._bloom is None and os.path.exists(self.bloom_path):
+            os.remove(self.bloom_path)  # built without them; _open_bloom() rebuilds it from the index
+
+    def _open_reader(self):
+        """
+        A read-only connection to the index for was_issued(), or None if there
+        is no index yet. Unlike _open_index() it never creates or fills the index.
+        """
+        if self._index is not None:
+            return self._index  # already open for writing, and up to date
+        if self._reader is None and os.path.exists(self.index_path):
+            # Imported here: urllib.request costs the generators more start-up
+            # time than everything else they import
+            from urllib.request import pathname2url
+            uri = f"file:{pathname2url(os.path.abspath(self.index_path))}?mode=ro"
+            self._reader = sqlite3.connect(uri, uri=True)
+        return self._reader
+
+    def was_issued(self, password):
+        """
+        True if this password was ever recorded (buffered or on disk). A pure
+        query: it creates no key, index or filter and writes to none of them.
+        Plaintext entries that the index doesn't cover yet are read from the log.
+        """
+        if self._load_key(create=False) is not None:
+            fingerprint = self.fingerprint(password)
+            if fingerprint in self._pending:
+                return True
+            reader = self._open_reader()
+            if reader is not None:
+                if reader.execute("SELECT 1 FROM issued WHERE fingerprint = ?", (fingerprint,)).fetchone():
+                    return True
+                if reader.execute("PRAGMA user_version").fetchone()[0] >= INDEX_VERSION:
+                    return False  # the index covers the plaintext entries too
+        return any(entry == password for entry, _ in self._plaintext_entries())
+
+    # --- De-duplication ---
+
+    def _open_bloom(self):
+        """The Bloom filter, opened on first use; built from the index if its file is missing."""
+        if self._bloom is None:
+            index = self._open_index()  # first, so the plaintext entries are indexed
+            if os.path.exists(self.bloom_path):
+                self._bloom = BloomFilter(self.bloom_path)
+            else:
+                fingerprints = (row[0] for row in index.execute("SELECT fingerprint FROM issued"))
+                self._bloom = BloomFilter.create(self.bloom_path, self.bloom_capacity, fingerprints=fingerprints)
+        return self._bloom
+
+    def is_new(self, password):
+        """
+        True if the password was never recorded. A filter miss answers at once;
+        a filter hit is confirmed against the exact index.
+        """
+        fingerprint = self.fingerprint(password)
+        if fingerprint not in self._open_bloom():
+            return True
+        self.bloom_hits += 1
+        return not self._is_indexed(fingerprint)
+
+    def _is_indexed(self, fingerprint):
+        if fingerprint in self._pending:
+            return True
+        if not os.path.exists(self.index_path):
+            return False
+        row = self._open_index().execute("SELECT 1 FROM issued WHERE fingerprint = ?", (fingerprint,)).fetchone()
+        return row is not None
+
+    def close(self):
+        """Flushes the buffer and closes the index and filter (called automatically at exit)."""
+        self.flush()
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._bloom is not None:
+            self._bloom.close()
+            self._bloom = None
+
+
+def main(argv=None):
+    """
+    `python password_history.py [HISTORY_FILE] < passwords.txt` prints, for each
+    password on stdin, whether it was ever issued. Reading from stdin keeps the
+    passwords out of the shell history.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    history = PasswordHistory(argv[0] if argv else HISTORY_FILE)
+    for line in sys.stdin:
+        password = line.rstrip("\r\n")
+        if password:
+            print("issued" if history.was_issued(password) else "not issued")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
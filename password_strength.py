@@ -0,0 +1,331 @@
+"""
+Entropy-based password strength estimator.
+
+A password is scanned once. Every character is charged log2(pool size) bits,
+where the pool is the union of the character types the password uses. That
+is the cost of guessing it if it were random. Predictable parts are charged
+less:
+  * repeats, sequences and keyboard walks ("aaaa", "abcd", "4321", "qwer")
+    of 3+ characters cost PATTERN_BITS for every character after the first
+  * words from password_wordlist.txt (matched case-insensitively, with
+    common leetspeak undone) cost log2(rank) bits for the whole word, plus
+    a bit if it is capitalised
+The total is the entropy estimate in bits. The label is picked from
+STRENGTH_LEVELS.
+
+The wordlist is loaded into a trie once, on the first estimate.
+
+Run it directly to audit a file of passwords (one per line, or the
+password_history.txt format) across all CPU cores:
+    python password_strength.py dump.txt --results scores.tsv
+"""
+import argparse
+import collections
+import math
+import os
+import string
+import sys
+
+from pool_map import chunked, ordered_pool_map
+
+WORDLIST_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "password_wordlist.txt")
+MIN_WORD_LENGTH = 3
+PATTERN_BITS = 1.0  # per character that merely continues a repeat/sequence/walk
+
+# (minimum bits, label, color) from strongest down; the GUI uses the colors
+STRENGTH_LEVELS = [
+    (80.0, "Excellent", "green"),
+    (60.0, "Strong", "blue"),
+    (36.0, "Medium", "yellow"),
+    (0.0, "Weak", "red"),
+]
+
+# Character types and the pool each one contributes
+CHARACTER_POOLS = [
+    (set(string.ascii_lowercase), 26),
+    (set(string.ascii_uppercase), 26),
+    (set(string.digits), 10),
+    (set(string.punctuation), len(string.punctuation)),
+]
+OTHER_POOL = 100  # anything else (spaces, non-ASCII)
+
+LEET_TABLE = str.maketrans("4@3!1|0$5+7", "aaeiiiosstt")
+KEYBOARD_ROWS = ["1234567890-=", "qwertyuiop[]", "asdfghjkl;'", "zxcvbnm,./"]
+_WORD_END = ""  # trie key marking the end of a word (its value is the rank)
+
+
+def _keyboard_neighbours():
+    neighbours = set()
+    for row_index, row in enumerate(KEYBOARD_ROWS):
+        for column, key in enumerate(row):
+            if column + 1 < len(row):
+                neighbours.add((key, row[column + 1]))
+            if row_index + 1 < len(KEYBOARD_ROWS):
+                below = KEYBOARD_ROWS[row_index + 1]
+                for other in below[max(column - 1, 0):column + 1]:
+                    neighbours.add((key, other))
+    return neighbours | {(b, a) for a, b in neighbours}
+
+
+def _character_classes():
+    classes = {}
+    for bit, (chars, _) in enumerate(CHARACTER_POOLS):
+        for c in chars:
+            classes[c] = 1 << bit
+    return classes
+
+
+class StrengthEstimator:
+    """Holds the precomputed tables; one instance serves any number of estimates."""
+
+    def __init__(self, wordlist_path=WORDLIST_FILE):
+        self.trie = {}
+        self.word_count = 0
+        if os.path.exists(wordlist_path):
+            self.load_words(wordlist_path)
+        self.neighbours = _keyboard_neighbours()
+        self.classes = _character_classes()
+        # log2(pool size) for every combination of character types
+        self.pool_bits = []
+        for mask in range(1 << len(CHARACTER_POOLS)):
+            size = sum(pool for bit, (_, pool) in enumerate(CHARACTER_POOLS) if mask >> bit & 1)
+            self.pool_bits.append(math.log2(size) if size else 0.0)
+        self.other_bits = math.log2(OTHER_POOL)
+
+    def load_words(self, path):
+        """Adds the words in `path` (most frequent first) to the trie."""
+        with open(path, 'r') as file:
+            for line in file:
+                word = line.strip().lower().translate(LEET_TABLE)
+                if len(word) < MIN_WORD_LENGTH or line.startswith("#"):
+                    continue
+                node = self.trie
+                for c in word:
+                    node = node.setdefault(c, {})
+                if _WORD_END not in node:
+                    self.word_count += 1
+                    node[_WORD_END] = self.word_count
+
+    def estimate(self, password):
+        """
+        Estimates the password's entropy.
+
+        Returns:
+            tuple: (entropy in bits, label)
+        """
+        length = len(password)
+        if not length:
+            return 0.0, STRENGTH_LEVELS[-1][1]
+        lowered = password.lower()
+
+        # One pass: character types, and which characters continue a pattern run
+        classes = self.classes
+        neighbours = self.neighbours
+        mask = 0
+        other = False
+        patterned = [False] * length
+        previous_kind = None
+        run = 0
+        previous = lowered[0]
+        for index, c in enumerate(password):
+            bit = classes.get(c)
+            if bit is None:
+                other = True
+            else:
+                mask |= bit
+            if index == 0:
+                continue
+            current = lowered[index]
+            step = ord(current) - ord(previous)
+            if step == 0:
+                kind = 0
+            elif step == 1 or step == -1:
+                kind = step
+            elif (previous, current) in neighbours:
+                kind = 2
+            else:
+                kind = None
+            run = run + 1 if kind is not None and kind == previous_kind else (1 if kind is not None else 0)
+            if run >= 2:
+                # This relation is the second in a row: the run is 3+ characters long
+                patterned[index] = True
+                if run == 2:
+                    patterned[index - 1] = True
+            previous_kind = kind
+            previous = current
+
+        char_bits = self.pool_bits[mask] + (self.other_bits if other else 0.0)
+        costs = [PATTERN_BITS if p else char_bits for p in patterned]
+
+        # Dictionary words: charge the word once instead of per character, if cheaper
+        if self.trie:
+            normalized = lowered.translate(LEET_TABLE)
+            index = 0
+            while index < length:
+                node = self.trie
+                best_end = best_rank = None
+                for end in range(index, length):
+                    node = node.get(normalized[end])
+                    if node is None:
+                        break
+                    rank = node.get(_WORD_END)
+                    if rank is not None and end + 1 - index >= MIN_WORD_LENGTH:
+                        best_end, best_rank = end + 1, rank
+                if best_end is None:
+                    index += 1
+                    continue
+                word_bits = math.log2(best_rank + 1)
+                if password[index:best_end] != lowered[index:best_end]:
+                    word_bits += 1.0
+                if word_bits < sum(costs[index:best_end]):
+                    costs[index] = word_bits
+                    for position in range(index + 1, best_end):
+                        costs[position] = 0.0
+                index = best_end
+
+        bits = sum(costs)
+        for minimum, label, _ in STRENGTH_LEVELS:
+            if bits >= minimum:
+                return bits, label
+
+    def estimate_many(self, passwords):
+        """Batch form of estimate(): returns a list of (bits, label) in input order."""
+        estimate = self.estimate
+        return [estimate(password) for password in passwords]
+
+
+_default_estimator = None
+
+
+def get_estimator():
+    """Returns the shared estimator, loading the wordlist on first use."""
+    global _default_estimator
+    if _default_estimator is None:
+        _default_estimator = StrengthEstimator()
+    return _default_estimator
+
+
+def estimate_strength(password):
+    """Returns (entropy in bits, label) for one password."""
+    return get_estimator().estimate(password)
+
+
+def estimate_strengths(passwords):
+    """Returns (entropy in bits, label) for each password, in input order."""
+    return get_estimator().estimate_many(passwords)
+
+
+def strength_color(label):
+    """The GUI color for a strength label."""
+    for _, level_label, color in STRENGTH_LEVELS:
+        if level_label == label:
+            return color
+    return STRENGTH_LEVELS[-1][2]
+
+
+# --- Bulk Audit ---
+# A file is read in chunks of AUDIT_CHUNK_LINES lines and the chunks are scored
+# in a process pool (see pool_map.py), so files larger than RAM are audited in
+# constant memory.
+
+AUDIT_CHUNK_LINES = 5000
+HISTORY_MARKER = " | Password: "  # as written by password_history.py in plaintext mode
+FINGERPRINT_MARKER = " | Fingerprint: "
+
+
+def extract_password(line):
+    """
+    Returns the password on a line of a plain list or of password_history.txt,
+    or None if the line is blank or a history entry that holds only a fingerprint.
+    """
+    line = line.rstrip("\r\n")
+    if line.startswith("["):
+        if HISTORY_MARKER in line:
+            return line.split(HISTORY_MARKER, 1)[1]
+        if FINGERPRINT_MARKER in line:
+            return None
+    return line or None
+
+
+def _audit_chunk(numbered_lines):
+    """Scores one chunk; returns (result lines as text, label counts)."""
+    estimate = get_estimator().estimate
+    counts = collections.Counter()
+    rows = []
+    for number, line in numbered_lines:
+        password = extract_password(line)
+        if password is None:
+            continue
+        bits, label = estimate(password)
+        counts[label] += 1
+        rows.append(f"{number}\t{bits:.1f}\t{label}\n")
+    return "".join(rows), counts
+
+
+def audit_file(input_file, results_file=None, workers=None, chunk_lines=AUDIT_CHUNK_LINES):
+    """
+    Scores every password in `input_file`. If `results_file` is given, a line
+    'LINE_NUMBER<TAB>BITS<TAB>LABEL' is written for each password (passwords
+    themselves are not repeated).
+
+    Returns:
+        collections.Counter: passwords per strength label
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = chunked(enumerate(input_file, start=1), chunk_lines)
+    totals = collections.Counter()
+    for text, counts in ordered_pool_map(_audit_chunk, chunks, workers):
+        totals.update(counts)
+        if results_file is not None:
+            results_file.write(text)
+    return totals
+
+
+def format_histogram(counts, width=40):
+    """Renders the label counts as a text histogram, strongest first."""
+    total = sum(counts.values())
+    largest = max(counts.values(), default=0)
+    lines = [f"Audited {total:,} passwords"]
+    for _, label, _ in STRENGTH_LEVELS:
+        count = counts[label]
+        bar = "#" * (round(count / largest * width) if largest else 0)
+        share = count / total if total else 0
+        lines.append(f"  {label:10s} {count:>12,} {share:7.1%}  {bar}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Entry point for the audit command; returns an exit code."""
+    parser = argparse.ArgumentParser(description="Audit the strength of every password in a file.")
+    parser.add_argument("input", help="file with one password per line, or password_history.txt ('-' for stdin)")
+    parser.add_argument("--results", help="also write per-line results (LINE, BITS, LABEL) to this file ('-' for stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=0, help="processes to use (default: all cores)")
+    args = parser.parse_args(argv)
+
+    try:
+        input_file = sys.stdin if args.input == "-" else open(
+            args.input, 'r', encoding="utf-8", errors="surrogateescape")
+        results_file = None
+        if args.results == "-":
+            results_file = sys.stdout
+        elif args.results:
+            results_file = open(args.results, 'w', buffering=1 << 20, encoding="utf-8", errors="surrogateescape")
+        try:
+            counts = audit_file(input_file, results_file, args.workers)
+        finally:
+            if input_file is not sys.stdin:
+                input_file.close()
+            if results_file not in (None, sys.stdout):
+                results_file.close()
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    # Keep stdout clean for the results when they go there
+    summary = sys.stderr if args.results == "-" else sys.stdout
+    print(format_histogram(counts), file=summary)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
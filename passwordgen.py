@@ -1,18 +1,52 @@
-import customtkinter as ctk
-from tkinter import messagebox
-import random
-import string
-import pyperclip
-from datetime import datetime
+import sys
 import os
 
-# Set CustomTkinter theme and color
-ctk.set_appearance_mode("System")  # Options: "System" (default), "Dark", "Light"
-ctk.set_default_color_theme("blue")
+from password_engine import PasswordEngine, PasswordConfigError
+from password_history import HISTORY_FILE, PasswordHistory
+from password_strength import estimate_strength, strength_color
 
-class ModernPasswordGenerator(ctk.CTk):
+# The GUI toolkit is imported only when the window is built (see load_gui), so
+# the strength rating and the generator engine can be used headless.
+ctk = None
+messagebox = None
+_gui_class = None
+
+
+def load_gui():
+    """Imports CustomTkinter and applies the theme (once); returns the window class."""
+    global ctk, messagebox, _gui_class
+    if _gui_class is None:
+        import customtkinter
+        from tkinter import messagebox as tk_messagebox
+        ctk, messagebox = customtkinter, tk_messagebox
+
+        # Set CustomTkinter theme and color
+        ctk.set_appearance_mode("System")  # Options: "System" (default), "Dark", "Light"
+        ctk.set_default_color_theme("blue")
+
+        _gui_class = type("ModernPasswordGenerator", (PasswordGeneratorWindow, ctk.CTk),
+                          {"__module__": __name__, "__doc__": PasswordGeneratorWindow.__doc__})
+    return _gui_class
+
+
+def __getattr__(name):
+    # `from passwordgen import ModernPasswordGenerator` still works; it loads the GUI
+    if name == "ModernPasswordGenerator":
+        return load_gui()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_strength_rating(password):
+    """Rates the password strength from its estimated entropy; returns (label, color name)."""
+    _, label = estimate_strength(password)
+    # CustomTkinter uses string names for colors
+    return label, strength_color(label)
+
+
+class PasswordGeneratorWindow:
     """
     Password Generator using CustomTkinter for a modern, attractive GUI.
+    Combined with ctk.CTk into ModernPasswordGenerator by load_gui().
     """
     def __init__(self):
         super().__init__()
@@ -28,7 +62,10 @@ class ModernPasswordGenerator(ctk.CTk):
         self.exclude_ambiguous_var = ctk.BooleanVar(value=True) 
         self.password_output = ctk.StringVar()
         self.strength_var = ctk.StringVar(value="—") 
-        self.history_file = "password_history.txt"
+        self.history_file = HISTORY_FILE
+        self.history = PasswordHistory(self.history_file)
+        self._engine = None
+        self._engine_config = None
 
         self._create_widgets()
 
@@ -104,79 +141,40 @@ class ModernPasswordGenerator(ctk.CTk):
 
     def _get_strength_rating(self, password):
         """Rates the password strength."""
-        rating = 0
-        
-        if len(password) >= 16: rating += 3
-        elif len(password) >= 12: rating += 2
-        elif len(password) >= 8: rating += 1
-
-        if any(c.isupper() for c in password): rating += 1
-        if any(c.islower() for c in password): rating += 1
-        if any(c.isdigit() for c in password): rating += 1
-        if any(c in string.punctuation for c in password): rating += 1
-
-        # CustomTkinter uses string names for colors
-        if rating >= 6:
-            return "Excellent", "green"
-        elif rating >= 4:
-            return "Strong", "blue"
-        elif rating >= 2:
-            return "Medium", "yellow"
-        else:
-            return "Weak", "red"
+        return get_strength_rating(password)
+
+    def _get_engine(self):
+        """
+        Returns a PasswordEngine for the current settings. The engine (its
+        filtered character pool and sampling table) is only rebuilt when a
+        setting changes, not on every click.
+        """
+        config = (self.len_var.get(), self.upper_var.get(), self.lower_var.get(),
+                  self.digit_var.get(), self.symbol_var.get(), self.exclude_ambiguous_var.get())
+        if self._engine_config != config:
+            self._engine = PasswordEngine(*config)
+            self._engine_config = config
+        return self._engine
 
     def _generate_password(self):
-        # ... (This logic remains the same as before to preserve functionality)
-        p_length = self.len_var.get()
-        char_pool = ""
-        required_chars = []
-        
-        if self.upper_var.get():
-            char_pool += string.ascii_uppercase
-            required_chars.append(random.choice(string.ascii_uppercase))
-
-        if self.lower_var.get():
-            char_pool += string.ascii_lowercase
-            required_chars.append(random.choice(string.ascii_lowercase))
-
-        if self.digit_var.get():
-            char_pool += string.digits
-            required_chars.append(random.choice(string.digits))
-
-        if self.symbol_var.get():
-            safe_symbols = "!@#$%^&*-=_+" 
-            char_pool += safe_symbols
-            required_chars.append(random.choice(safe_symbols))
-
-        if not char_pool:
-            messagebox.showerror("Configuration Error", "Please select at least one character type.")
-            return None
-        
-        if self.exclude_ambiguous_var.get():
-            ambiguous_chars = 'l1IO0'
-            char_pool = "".join(c for c in char_pool if c not in ambiguous_chars)
-            required_chars = [random.choice(char_pool) for _ in required_chars] 
-
-        if p_length < len(required_chars):
-            messagebox.showerror("Length Error", f"Password length must be at least {len(required_chars)} to include all selected types.")
+        """Generates one password with the secure engine; shows an error and returns None if the settings are invalid."""
+        try:
+            engine = self._get_engine()
+        except PasswordConfigError as e:
+            messagebox.showerror(e.title, str(e))
             return None
-        
-        fill_length = p_length - len(required_chars) 
-        random_fill = [random.choice(char_pool) for _ in range(fill_length)]
-        final_password_list = required_chars + random_fill
-        random.shuffle(final_password_list)
-
-        return "".join(final_password_list)
+        # Never hand out a password this history has issued before
+        for _ in range(1000):
+            password = engine.generate_password()
+            if self.history.is_new(password):
+                return password
+        messagebox.showerror("Uniqueness Error",
+                             "No new passwords left for these settings; allow a longer length or more character types.")
+        return None
 
     def _log_history(self, password, strength):
-        """Logs the generated password and its strength."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = f"[{timestamp}] Strength: {strength} | Password: {password}\n"
-        try:
-            with open(self.history_file, "a") as f:
-                f.write(log_entry)
-        except IOError:
-            print(f"Warning: Could not write to history file: {self.history_file}")
+        """Logs the generated password's fingerprint and its strength (buffered; see password_history.py)."""
+        self.history.record(password, strength)
 
     def generate_and_display(self):
         """Runs logic, updates display, and logs."""
@@ -198,6 +196,7 @@ class ModernPasswordGenerator(ctk.CTk):
         current_password = self.password_output.get()
         if current_password:
             try:
+                import pyperclip
                 pyperclip.copy(current_password)
                 messagebox.showinfo("Copied!", "Password copied to clipboard.")
             except Exception:
@@ -205,7 +204,10 @@ class ModernPasswordGenerator(ctk.CTk):
         else:
             messagebox.showwarning("Copy Warning", "No password has been generated yet.")
 
-# Run the application
+# Run the application; with arguments, generate headless instead (see password_engine.py)
 if __name__ == "__main__":
-    app = ModernPasswordGenerator()
+    if len(sys.argv) > 1:
+        import password_engine
+        sys.exit(password_engine.main())
+    app = load_gui()()
     app.mainloop()
\ No newline at end of file
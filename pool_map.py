@@ -0,0 +1,43 @@
+"""
+Ordered, bounded process-pool map shared by the calculator's batch/stream
+modes and the password strength audit.
+
+Input is cut into chunks and the chunks are spread over a process pool. Only
+a bounded number of chunks is in flight at once, so a stream of any length can
+be fed through in constant memory, and results come back in input order.
+"""
+import collections
+import itertools
+
+IN_FLIGHT_PER_WORKER = 2  # chunks queued per worker: enough to keep every worker busy
+
+
+def chunked(items, chunk_size):
+    """Yields lists of up to `chunk_size` items from any iterable."""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def ordered_pool_map(function, chunks, workers):
+    """
+    Applies `function` to each chunk in a pool of `workers` processes and yields
+    the results in order. With one worker everything runs in this process.
+    """
+    if workers <= 1:
+        yield from map(function, chunks)
+        return
+    # Imported here: multiprocessing roughly doubles the import time of the
+    # tools that only need it for bulk runs
+    import multiprocessing
+    with multiprocessing.Pool(workers) as pool:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(function, (chunk,)))
+            if len(pending) >= workers * IN_FLIGHT_PER_WORKER:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()